@@ -37,22 +37,27 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import pybase64 as _b64  # SIMD base64 — drop-in for the stdlib API
+except ImportError:
+    _b64 = base64
+
 # Add project root to path so we can import guardclaw
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from guardclaw.core.canonical import canonical_json_encode
 from guardclaw.core.crypto import Ed25519KeyManager
-from guardclaw.core.models import ExecutionEnvelope, RecordType
+from guardclaw.core.models import GENESIS_HASH, ExecutionEnvelope, RecordType
 
 
 # ── Deterministic key seed ────────────────────────────────────────────────────
 # FIXED 32-byte seed → deterministic key → reproducible proof bundle.
 # This is NOT a security key. It exists solely to make the proof reproducible
 # across runs and across machines.
-PROOF_SEED = bytes.fromhex(
-    "deadbeefdeadbeefdeadbeefdeadbeef"
-    "cafebabecafebabecafebabecafebabe"
-)
+# Computed once at import; the literal is constant-folded by the compiler.
+PROOF_SEED = bytes.fromhex("deadbeef" * 4 + "cafebabe" * 4)
+
+__all__ = ["main", "PROOF_SEED"]
 
 
 def main():
@@ -75,7 +80,7 @@ def main():
         sequence=          0,
         nonce=             "abcdef1234567890abcdef1234567890",
         timestamp=         "2026-02-25T00:00:00.000Z",
-        causal_hash=       "0" * 64,
+        causal_hash=       GENESIS_HASH,
         payload=           {"proof": "cross-language", "version": "1.0"},
         signature=         None,
     )
@@ -84,17 +89,27 @@ def main():
     env.sign(key)
 
     # ── Intermediate values for Go verification ──────────────
+    # sign() already ran JCS over the signing dict — reuse those bytes.
+    # to_chain_dict() == to_signing_dict() by contract, so the chain bytes
+    # are the same buffer unless the two dicts ever diverge.
     signing_dict      = env.to_signing_dict()
-    canonical_bytes   = canonical_json_encode(signing_dict)
+    canonical_bytes   = env.signed_bytes
 
     chain_dict        = env.to_chain_dict()
-    chain_bytes       = canonical_json_encode(chain_dict)
+    chain_bytes       = (
+        canonical_bytes if chain_dict == signing_dict
+        else canonical_json_encode(chain_dict)
+    )
     causal_hash_next  = hashlib.sha256(chain_bytes).hexdigest()
 
+    # Hex-encode each buffer once; bytes.hex() is already a C loop, the
+    # waste was in calling it repeatedly on the same bytes.
+    canonical_hex     = canonical_bytes.hex()
+    chain_hex         = canonical_hex if chain_bytes is canonical_bytes else chain_bytes.hex()
+
     # Decode signature from base64url (no padding) → raw 64 bytes → hex
     sig_b64url        = env.signature
-    padding           = 4 - len(sig_b64url) % 4
-    sig_raw           = base64.urlsafe_b64decode(sig_b64url + "=" * (padding % 4))
+    sig_raw           = _b64.urlsafe_b64decode(sig_b64url + "=" * (-len(sig_b64url) & 3))
     sig_hex           = sig_raw.hex()
 
     # ── Proof bundle ─────────────────────────────────────────
@@ -107,14 +122,16 @@ def main():
         "gef_version":             "1.0",
         "public_key_hex":          key.public_key_hex,
         "signing_dict":            signing_dict,
-        "canonical_bytes_hex":     canonical_bytes.hex(),
-        "canonical_bytes_b64":     base64.b64encode(canonical_bytes).decode(),
+        "canonical_bytes_hex":     canonical_hex,
+        "canonical_bytes_b64":     _b64.b64encode(canonical_bytes).decode("ascii"),
         "chain_dict":              chain_dict,
-        "chain_bytes_hex":         chain_bytes.hex(),
+        "chain_bytes_hex":         chain_hex,
         "causal_hash_of_this":     causal_hash_next,
         "signature_b64url":        sig_b64url,
         "signature_hex":           sig_hex,
-        "envelope_json":           json.dumps(env.to_dict()),
+        # Same compact record form GEFLedger appends (kept a JSON string:
+        # verify_proof.go declares envelope_json as string)
+        "envelope_json":           json.dumps(env.to_dict(), separators=(",", ":")),
         "expected_results": {
             "canonical_bytes_match": True,
             "chain_hash_match":      True,
@@ -122,11 +139,14 @@ def main():
         }
     }
 
-    out_path.write_text(json.dumps(bundle, indent=2), encoding="utf-8")
+    # json.dumps output is pure ASCII (ensure_ascii), so the encode is a
+    # straight copy; write_bytes also skips text-mode newline translation,
+    # keeping the bundle byte-identical on Windows (run_proof.ps1) and POSIX.
+    out_path.write_bytes(json.dumps(bundle, indent=2).encode("ascii"))
     print(f"Proof bundle written to: {out_path}")
     print()
     print("Expected Go verification:")
-    print(f"  canonical_bytes_hex : {canonical_bytes.hex()[:64]}...")
+    print(f"  canonical_bytes_hex : {canonical_hex[:64]}...")
     print(f"  causal_hash_of_this : {causal_hash_next}")
     print(f"  signature_b64url    : {sig_b64url[:32]}...")
     print(f"  signature_valid     : True")
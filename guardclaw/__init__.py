@@ -9,26 +9,73 @@ GEF v1.0 - GuardClaw Evidence Format
 __version__     = "0.7.0"
 __gef_version__ = "1.0"
 
-from guardclaw.core.models import (
-    ExecutionEnvelope,
-    GEF_VERSION,
-    GENESIS_HASH,
-    RecordType,
-    SchemaValidationResult,
-    GEFVersionError,
-)
-from guardclaw.core.ledger import GEFLedger
-from guardclaw.core.emitter import (
-    init_global_ledger,
-    get_global_ledger,
-    has_global_ledger,       # FIX: was missing â€” required by trace.py
-    set_global_ledger,
-)
-from guardclaw.core.crypto import Ed25519KeyManager
-from guardclaw.core.canonical import canonical_json_encode
-from guardclaw.core.time import gef_timestamp
-from guardclaw.api import GEFSession, session, record_action, verify_ledger
-from guardclaw.trace import trace
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names other than `trace` (see below) are resolved on first
+# attribute access (PEP 562) instead of all being imported up front.
+_LAZY_EXPORTS = {
+    "ExecutionEnvelope":      "guardclaw.core.models",
+    "GEF_VERSION":            "guardclaw.core.models",
+    "GENESIS_HASH":           "guardclaw.core.models",
+    "RecordType":             "guardclaw.core.models",
+    "SchemaValidationResult": "guardclaw.core.models",
+    "GEFVersionError":        "guardclaw.core.models",
+    "GEFLedger":              "guardclaw.core.ledger",
+    "init_global_ledger":     "guardclaw.core.emitter",
+    "get_global_ledger":      "guardclaw.core.emitter",
+    "has_global_ledger":      "guardclaw.core.emitter",  # required by trace.py
+    "set_global_ledger":      "guardclaw.core.emitter",
+    "Ed25519KeyManager":      "guardclaw.core.crypto",
+    "canonical_json_encode":  "guardclaw.core.canonical",
+    "gef_timestamp":          "guardclaw.core.time",
+    "GEFSession":             "guardclaw.api",
+    "session":                "guardclaw.api",
+    "record_action":          "guardclaw.api",
+    "verify_ledger":          "guardclaw.api",
+}
+
+
+# Imported eagerly, not lazily: importing the guardclaw.trace submodule
+# binds it as the package attribute `trace`, which would shadow the
+# decorator and bypass __getattr__. The from-import below rebinds the name
+# to the decorator once, after the submodule has loaded.
+from guardclaw.trace import trace  # noqa: E402
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'guardclaw' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache on the package
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+if TYPE_CHECKING:
+    from guardclaw.core.models import (
+        ExecutionEnvelope,
+        GEF_VERSION,
+        GENESIS_HASH,
+        RecordType,
+        SchemaValidationResult,
+        GEFVersionError,
+    )
+    from guardclaw.core.ledger import GEFLedger
+    from guardclaw.core.emitter import (
+        init_global_ledger,
+        get_global_ledger,
+        has_global_ledger,
+        set_global_ledger,
+    )
+    from guardclaw.core.crypto import Ed25519KeyManager
+    from guardclaw.core.canonical import canonical_json_encode
+    from guardclaw.core.time import gef_timestamp
+    from guardclaw.api import GEFSession, session, record_action, verify_ledger
 
 __all__ = [
     # Core types
@@ -0,0 +1,44 @@
+"""
+GuardClaw Phase 5: helpers shared by the adapters.
+
+Not part of the public adapter API.
+"""
+
+import hashlib
+import sys
+from typing import Any, Callable, Dict
+
+
+def _blake2b_256(data: bytes = b"") -> Any:
+    """BLAKE2b with a 32-byte digest — same hex length as SHA-256."""
+    return hashlib.blake2b(data, digest_size=32)
+
+
+# hash_algorithm name → hashlib-style constructor (callable with bytes or nothing)
+HASH_ALGORITHMS: Dict[str, Callable[..., Any]] = {
+    "blake2b": _blake2b_256,
+    "sha256": hashlib.sha256,
+}
+
+
+# class → interned __name__. Built-in types re-create their __name__ string on
+# every access; this hands back one shared object per class instead.
+_TYPE_NAMES: Dict[type, str] = {}
+_TYPE_NAMES_MAX = 256
+
+
+def type_name(obj: Any) -> str:
+    """Interned type(obj).__name__, cached by class identity."""
+    cls  = type(obj)
+    name = _TYPE_NAMES.get(cls)
+    if name is None:
+        name = sys.intern(cls.__name__)
+        if len(_TYPE_NAMES) < _TYPE_NAMES_MAX:
+            _TYPE_NAMES[cls] = name
+    return name
+
+
+def intern_str(value: Any) -> Any:
+    """sys.intern() for exact str; str subclasses (e.g. str Enums) and other
+    values pass through unchanged, since sys.intern() rejects them."""
+    return sys.intern(value) if type(value) is str else value
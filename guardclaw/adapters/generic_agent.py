@@ -20,9 +20,15 @@ Usage:
     observer.observe_result(result)
 """
 
+import json
+
+from guardclaw.adapters._common import HASH_ALGORITHMS as _HASH_ALGORITHMS
+from guardclaw.adapters._common import intern_str as _intern
+from guardclaw.adapters._common import type_name as _type_name
+from guardclaw.core.canonical import canonical_json_encode
 from guardclaw.core.emitter import get_global_ledger as get_global_emitter
+from guardclaw.core.time import utc_isoformat_now
 from typing import Any, Optional, Dict, Callable
-from datetime import datetime, timezone
 
 from guardclaw.core.observers import Observer
 
@@ -38,6 +44,11 @@ class GenericAgentObserver:
     - Non-blocking (async emission)
     - No agent modification required
     - Failure-safe (agent runs even if observer fails)
+
+    Context and result digests are BLAKE2b-256 over RFC 8785 canonical
+    JSON by default. hash_algorithm="sha256" reproduces the original
+    digests instead — SHA-256 of json.dumps(context, sort_keys=True) and
+    of str(result) — so hashes stay comparable with older ledgers.
     
     Example:
         observer = GenericAgentObserver("agent-001")
@@ -51,11 +62,16 @@ class GenericAgentObserver:
         # Observe result
         observer.observe_result(result)
     """
+
+    __slots__ = (
+        "agent_id", "observer", "current_execution_id", "_hash", "_legacy", "__weakref__",
+    )
     
     def __init__(
         self,
         agent_id: str,
-        observer: Optional[Observer] = None
+        observer: Optional[Observer] = None,
+        hash_algorithm: str = "blake2b",
     ):
         """
         Initialize generic agent observer.
@@ -63,8 +79,20 @@ class GenericAgentObserver:
         Args:
             agent_id: Agent identifier
             observer: Observer instance (creates new if None)
+            hash_algorithm: Digest for context/result hashes — "blake2b"
+                (BLAKE2b-256 over canonical JSON, default) or "sha256" to
+                keep producing the digests older ledgers were written with
         """
+        if hash_algorithm not in _HASH_ALGORITHMS:
+            raise ValueError(
+                f"Invalid hash_algorithm: {hash_algorithm!r}. "
+                f"Must be one of {sorted(_HASH_ALGORITHMS)}."
+            )
         self.agent_id = agent_id
+        self._hash = _HASH_ALGORITHMS[hash_algorithm]
+        # sha256 keeps the original json.dumps / str() framing, so its
+        # digests match ledgers written before the canonical-JSON framing.
+        self._legacy = hash_algorithm == "sha256"
         self.observer = observer or Observer()
         self.current_execution_id: Optional[str] = None
     
@@ -117,7 +145,7 @@ class GenericAgentObserver:
         
         event = self.observer.observe_execution(
             subject_id=self.agent_id,
-            action=action,
+            action=_intern(action),
             execution_timestamp=execution_time,
             correlation_id=correlation_id or self.current_execution_id,
             context_hash=self._hash_context(context) if context else None,
@@ -150,7 +178,7 @@ class GenericAgentObserver:
             result_hash=self._hash_result(result),
             execution_timestamp=execution_time,
             correlation_id=correlation_id or self.current_execution_id,
-            metadata={"result_type": type(result).__name__}
+            metadata={"result_type": _type_name(result)}
         )
         
         return event.event_id
@@ -178,7 +206,7 @@ class GenericAgentObserver:
             failure_reason=str(error),
             execution_timestamp=execution_time,
             correlation_id=correlation_id or self.current_execution_id,
-            metadata={"error_type": type(error).__name__}
+            metadata={"error_type": _type_name(error)}
         )
         
         return event.event_id
@@ -214,22 +242,59 @@ class GenericAgentObserver:
     
     def _utc_now(self) -> str:
         """Get current UTC timestamp."""
-        return datetime.now(timezone.utc).isoformat()
+        return utc_isoformat_now()
     
     def _hash_context(self, context: Dict[str, Any]) -> str:
-        """Hash context (privacy-safe)."""
-        import hashlib
-        import json
-        
-        context_str = json.dumps(context, sort_keys=True)
-        return hashlib.sha256(context_str.encode()).hexdigest()
+        """
+        Hash context (privacy-safe). BLAKE2b-256 over RFC 8785 canonical JSON.
+
+        Same encoder used for signing, so any JCS implementation can
+        reproduce the hash from the same context. Contexts JCS can't encode
+        (non-str keys, NaN, non-JSON values) are hashed over str() instead.
+
+        With hash_algorithm="sha256": SHA-256 of json.dumps(context,
+        sort_keys=True), with the same str() fallback.
+        """
+        try:
+            if self._legacy:
+                context_bytes = json.dumps(context, sort_keys=True).encode()
+            else:
+                context_bytes = canonical_json_encode(context)
+        except Exception:
+            context_bytes = str(context).encode("utf-8", "surrogatepass")
+        return self._hash(context_bytes).hexdigest()
     
     def _hash_result(self, result: Any) -> str:
-        """Hash result (never store raw)."""
-        import hashlib
-        
-        result_str = str(result)
-        return hashlib.sha256(result_str.encode()).hexdigest()
+        """
+        Hash result (never store raw).
+
+        bytes-like  → hashed as-is (no copy, no str()); a non-contiguous
+                      memoryview is copied to bytes first
+        dict / list → hashed over canonical JSON (no Python repr built)
+        anything else, or containers JSON can't encode (non-JSON values,
+        non-str keys, cycles, nesting too deep to recurse), or a released
+        memoryview → hashed over str()
+
+        With hash_algorithm="sha256": SHA-256 of str(result), whatever its type.
+        """
+        if self._legacy:
+            return self._hash(str(result).encode("utf-8", "surrogatepass")).hexdigest()
+        if isinstance(result, (bytes, bytearray)):
+            return self._hash(result).hexdigest()
+        if isinstance(result, memoryview):
+            try:
+                view = result if result.c_contiguous else result.tobytes()
+                return self._hash(view).hexdigest()
+            except ValueError:  # released view — falls through to str()
+                pass
+        if isinstance(result, (dict, list, tuple)):
+            try:
+                result_bytes = canonical_json_encode(result)
+            except Exception:
+                result_bytes = str(result).encode("utf-8", "surrogatepass")
+        else:
+            result_bytes = str(result).encode("utf-8", "surrogatepass")
+        return self._hash(result_bytes).hexdigest()
     
     def stop(self) -> None:
         """Stop observer gracefully."""
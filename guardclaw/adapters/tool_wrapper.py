@@ -18,12 +18,25 @@ This is how GuardClaw becomes invisible.
 """
 
 from typing import Callable, Any, Optional, Dict
-from datetime import datetime, timezone
+import atexit
 import functools
 import hashlib
 import json
+import queue
+import random
+import threading
+import warnings
+import weakref
 
+from guardclaw.adapters._common import HASH_ALGORITHMS as _HASH_ALGORITHMS
+from guardclaw.adapters._common import type_name as _type_name
 from guardclaw.core.observers import Observer
+from guardclaw.core.time import utc_isoformat_now
+
+
+# Bound once — wrapped() samples with a single global lookup
+_rand = random.random
+
 
 
 class ToolObserver:
@@ -38,15 +51,65 @@ class ToolObserver:
     IMPORTANT:
     - Tool behavior is NEVER modified
     - Exceptions propagate normally
-    - Observer failure does not affect execution
+    - Observer failure does not affect execution; the first observer
+      exception issues one RuntimeWarning, and wrapped calls then stop
+      observing and run the tool directly
+
+    background=True moves the observer calls onto one daemon worker
+    thread. The caller still captures the timestamp and hashes inputs
+    and result (so later mutation cannot change them). The EXECUTION
+    observation is queued before the tool runs and RESULT/FAILURE after
+    it returns; the worker emits them in that order. Call stop() to flush
+    the queue — calls that finish after stop() observe synchronously.
+    Observers still running at interpreter exit are flushed by an atexit
+    hook, so queued observations are never dropped with the daemon worker.
+    The worker holds no reference to its ToolObserver between
+    observations: an observer that is no longer referenced is collected
+    and its worker ends once the queue is drained.
+
+    sample_rate < 1.0 records only that fraction of calls, chosen at
+    random; skipped calls do no hashing and no observer work. This trades
+    audit completeness for throughput — unsampled calls leave no trace.
     """
+
+    __slots__ = (
+        "tool_name",
+        "subject_id",
+        "observer",
+        "_hash",
+        "_legacy_inputs",
+        "_observer_healthy",
+        "_event_kwargs",
+        "_queue",
+        "_worker",
+        "_finalizer",
+        "_lock",
+        "_sample_rate",
+        "__weakref__",
+    )
+
+    tool_name: str
+    subject_id: str
+    observer: Observer
+    _hash: Callable[..., Any]
+    _legacy_inputs: bool
+    _observer_healthy: bool
+    _event_kwargs: Dict[str, str]
+    _queue: Optional[queue.SimpleQueue]
+    _worker: Optional[threading.Thread]
+    _finalizer: Optional[weakref.finalize]
+    _lock: threading.Lock
+    _sample_rate: float
     
     def __init__(
         self,
         tool_name: str,
         subject_id: str,
-        observer: Optional[Observer] = None
-    ):
+        observer: Optional[Observer] = None,
+        hash_algorithm: str = "blake2b",
+        background: bool = False,
+        sample_rate: float = 1.0,
+    ) -> None:
         """
         Initialize tool observer.
         
@@ -54,10 +117,58 @@ class ToolObserver:
             tool_name: Logical tool name (e.g. "file:delete")
             subject_id: Agent or system invoking the tool
             observer: Observer instance (creates new if None)
+            hash_algorithm: Digest for input/result hashes — "blake2b"
+                (BLAKE2b-256, default) or "sha256" to keep producing the
+                digests older ledgers were written with
+            background: Emit observations from a worker thread instead of
+                the calling thread
+            sample_rate: Fraction of calls to observe, 0.0–1.0 (default
+                1.0 = every call)
         """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(
+                f"Invalid sample_rate: {sample_rate!r}. Must be between 0.0 and 1.0."
+            )
+        if hash_algorithm not in _HASH_ALGORITHMS:
+            raise ValueError(
+                f"Invalid hash_algorithm: {hash_algorithm!r}. "
+                f"Must be one of {sorted(_HASH_ALGORITHMS)}."
+            )
         self.tool_name = tool_name
         self.subject_id = subject_id
         self.observer = observer or Observer()
+        self._hash = _HASH_ALGORITHMS[hash_algorithm]
+        # sha256 keeps the original JSON-document input framing, so its
+        # digests match ledgers written before the length-prefixed framing.
+        self._legacy_inputs = hash_algorithm == "sha256"
+        # Cleared on the first observer exception; wrapped tools then skip
+        # observation and call straight through.
+        self._observer_healthy = True
+        # subject_id/action are identical on every event — build them once
+        self._event_kwargs = {"subject_id": subject_id, "action": tool_name}
+        self._sample_rate = sample_rate
+
+        self._queue = None
+        self._worker = None
+        self._finalizer = None
+        # Guards _queue: stop() holds it while flushing, so no call can
+        # enqueue behind the sentinel.
+        self._lock = threading.Lock()
+        if background:
+            self._queue = q = queue.SimpleQueue()
+            self._worker = threading.Thread(
+                target=_drain_queue,
+                args=(q,),
+                name=f"guardclaw-tool-observer-{tool_name}",
+                daemon=True,
+            )
+            self._worker.start()
+            # Ends the worker if this observer is collected without stop().
+            # Only live observers need flushing at exit — that is
+            # _drain_background_observers()' job, not the finalizer's.
+            self._finalizer = weakref.finalize(self, q.put, None)
+            self._finalizer.atexit = False
+            _BACKGROUND_OBSERVERS.add(self)
     
     def wrap(self, tool_fn: Callable) -> Callable:
         """
@@ -71,78 +182,194 @@ class ToolObserver:
         """
         
         @functools.wraps(tool_fn)
-        def wrapped(*args, **kwargs):
+        def wrapped(*args: Any, **kwargs: Any) -> Any:
+            # Observer already failed once — stay out of the tool's way.
+            if not self._observer_healthy:
+                return tool_fn(*args, **kwargs)
+            # Unsampled call — skip hashing and observation entirely.
+            if self._sample_rate < 1.0 and _rand() >= self._sample_rate:
+                return tool_fn(*args, **kwargs)
+            if self._queue is not None:
+                return self._call_queued(tool_fn, args, kwargs)
+            
             execution_time = self._utc_now()  # Capture ONCE at start
             execution_event_id = None
             
             # 1️⃣ Observe execution attempt
             try:
                 event = self.observer.observe_execution(
-                    subject_id=self.subject_id,
-                    action=self.tool_name,
+                    **self._event_kwargs,
                     execution_timestamp=execution_time,  # Use captured time
                     context_hash=self._hash_inputs(args, kwargs)
                 )
                 execution_event_id = event.event_id
-            except Exception:
+            except Exception as e:
                 # Observer failure MUST NOT affect execution
-                execution_event_id = None
+                self._observer_failed(e)
             
             # 2️⃣ Execute tool (unmodified)
             try:
                 result = tool_fn(*args, **kwargs)
+            except Exception as e:
+                # 4️⃣ Observe failure
+                if self._observer_healthy:
+                    try:
+                        self.observer.observe_failure(
+                            **self._event_kwargs,
+                            failure_reason=str(e),
+                            execution_timestamp=execution_time,  # FIXED: Use captured time
+                            correlation_id=execution_event_id,
+                            metadata={"error_type": _type_name(e)}
+                        )
+                    except Exception as obs_error:
+                        self._observer_failed(obs_error)  # Observer failure ignored
                 
-                # 3️⃣ Observe result
+                # IMPORTANT: re-raise original exception
+                raise
+            
+            # 3️⃣ Observe result
+            if self._observer_healthy:
                 try:
                     self.observer.observe_result(
-                        subject_id=self.subject_id,
-                        action=self.tool_name,
+                        **self._event_kwargs,
                         result_hash=self._hash_result(result),
                         execution_timestamp=execution_time,  # FIXED: Use captured time
                         correlation_id=execution_event_id,
-                        metadata={"result_type": type(result).__name__}
+                        metadata={"result_type": _type_name(result)}
                     )
-                except Exception:
-                    pass  # Observer failure ignored
-                
-                return result
+                except Exception as e:
+                    self._observer_failed(e)  # Observer failure ignored
             
-            except Exception as e:
-                # 4️⃣ Observe failure
-                try:
-                    self.observer.observe_failure(
-                        subject_id=self.subject_id,
-                        action=self.tool_name,
-                        failure_reason=str(e),
-                        execution_timestamp=execution_time,  # FIXED: Use captured time
-                        correlation_id=execution_event_id,
-                        metadata={"error_type": type(e).__name__}
-                    )
-                except Exception:
-                    pass  # Observer failure ignored
-                
-                # IMPORTANT: re-raise original exception
-                raise
+            return result
         
         return wrapped
     
+    def _call_queued(self, tool_fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Queue EXECUTION, run tool_fn, then queue RESULT/FAILURE."""
+        execution_time = self._utc_now()
+        # Filled in with the EXECUTION event_id once it is emitted, so the
+        # RESULT/FAILURE item can correlate to it.
+        event_id = [None]
+        self._enqueue(
+            (execution_time, event_id, None, self._hash_inputs(args, kwargs), None)
+        )
+        try:
+            result = tool_fn(*args, **kwargs)
+        except Exception as e:
+            self._enqueue((execution_time, event_id, False, str(e), _type_name(e)))
+            raise
+        self._enqueue(
+            (execution_time, event_id, True, self._hash_result(result), _type_name(result))
+        )
+        return result
+    
+    def _enqueue(self, item: tuple) -> None:
+        """Hand item to the worker, or emit it here once stop() has run."""
+        # An observer callback on the worker calling one of this observer's
+        # tools: emit inline — queueing would wait on _lock, which stop()
+        # holds while it joins this very thread.
+        if threading.current_thread() is self._worker:
+            self._emit(item)
+            return
+        with self._lock:
+            q = self._queue
+            if q is not None:
+                q.put_nowait((self, item))
+                return
+        self._emit(item)
+    
+    def _emit(self, item: tuple) -> None:
+        """
+        Send one queued observation to the observer.
+
+        item is (execution_time, event_id, outcome, detail, type_name):
+        outcome None is EXECUTION (detail = context hash), True is RESULT
+        (detail = result hash), False is FAILURE (detail = error message).
+        """
+        if not self._observer_healthy:
+            return
+        execution_time, event_id, outcome, detail, type_name = item
+        try:
+            if outcome is None:
+                event = self.observer.observe_execution(
+                    **self._event_kwargs,
+                    execution_timestamp=execution_time,
+                    context_hash=detail,
+                )
+                event_id[0] = event.event_id
+            elif outcome:
+                self.observer.observe_result(
+                    **self._event_kwargs,
+                    result_hash=detail,
+                    execution_timestamp=execution_time,
+                    correlation_id=event_id[0],
+                    metadata={"result_type": type_name},
+                )
+            else:
+                self.observer.observe_failure(
+                    **self._event_kwargs,
+                    failure_reason=detail,
+                    execution_timestamp=execution_time,
+                    correlation_id=event_id[0],
+                    metadata={"error_type": type_name},
+                )
+        except Exception as e:
+            self._observer_failed(e)  # Observer failure ignored
+    
+    def _observer_failed(self, error: Exception) -> None:
+        """Stop observing after an observer exception, and say so once."""
+        if self._observer_healthy:
+            self._observer_healthy = False
+            warnings.warn(
+                f"GuardClaw observer for tool {self.tool_name!r} failed "
+                f"({type(error).__name__}: {error}); further calls run "
+                "unobserved and record no evidence.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+    
     def _utc_now(self) -> str:
-        """Get current UTC timestamp."""
-        return datetime.now(timezone.utc).isoformat()
+        """Get current UTC timestamp (no datetime built per call)."""
+        return utc_isoformat_now()
     
     def _hash_inputs(self, args: tuple, kwargs: dict) -> str:
         """
         Hash tool inputs (privacy-safe).
         
         Never store raw inputs.
+
+        Each str(arg) and each kwarg name/str(value) is fed straight into
+        the hasher with a tag and byte-length prefix — no intermediate JSON
+        document is built. The length prefix keeps the framing unambiguous
+        whatever the values contain. Kwargs are taken in sorted name order.
+
+        With hash_algorithm="sha256" the original framing is kept instead:
+        SHA-256 of json.dumps({"args": [...], "kwargs": {...}},
+        sort_keys=True) over the same str() values.
         """
         try:
-            payload = {
-                "args": [str(a) for a in args],  # Convert to strings
-                "kwargs": {k: str(v) for k, v in kwargs.items()}
-            }
-            payload_str = json.dumps(payload, sort_keys=True)
-            return hashlib.sha256(payload_str.encode()).hexdigest()
+            if self._legacy_inputs:
+                payload = {
+                    "args": [str(a) for a in args],
+                    "kwargs": {k: str(v) for k, v in kwargs.items()},
+                }
+                payload_str = json.dumps(payload, sort_keys=True)
+                return hashlib.sha256(payload_str.encode()).hexdigest()
+            h = self._hash()
+            update = h.update
+            for a in args:
+                b = str(a).encode("utf-8", "surrogatepass")
+                update(b"a%d:" % len(b))
+                update(b)
+            # Positional-only calls (the common tool shape) skip the sort
+            for k in (sorted(kwargs) if kwargs else ()):
+                kb = k.encode("utf-8", "surrogatepass")
+                vb = str(kwargs[k]).encode("utf-8", "surrogatepass")
+                update(b"k%d:" % len(kb))
+                update(kb)
+                update(b"v%d:" % len(vb))
+                update(vb)
+            return h.hexdigest()
         except Exception:
             return "hash_error"
     
@@ -153,21 +380,67 @@ class ToolObserver:
         Never store raw outputs.
         """
         try:
-            return hashlib.sha256(str(result).encode()).hexdigest()
+            return self._hash(str(result).encode()).hexdigest()
         except Exception:
             return "hash_error"
     
     def stop(self) -> None:
-        """Stop observer gracefully."""
+        """Stop observer gracefully (flushes queued observations first)."""
+        self._stop_worker()
         self.observer.stop(reason=f"Tool observer stopped: {self.tool_name}")
+    
+    def _stop_worker(self) -> None:
+        """Drain the background queue and end the worker thread, if any."""
+        _BACKGROUND_OBSERVERS.discard(self)
+        # Held until the worker has drained everything queued so far;
+        # calls racing with stop() wait here, then observe synchronously.
+        with self._lock:
+            if self._worker is not None:
+                # detach(), not finalizer(): finalizers are disabled once
+                # weakref's own atexit hook has run, and this runs at exit too
+                self._finalizer.detach()
+                self._queue.put(None)
+                self._worker.join()
+                self._worker = None
+                self._queue = None
+
+
+def _drain_queue(q: queue.SimpleQueue) -> None:
+    """
+    Worker loop: emit queued (tool_observer, item) pairs until the None
+    sentinel. The observer is dropped after each item, so an idle worker
+    never keeps its ToolObserver alive.
+    """
+    get = q.get
+    while True:
+        entry = get()
+        if entry is None:
+            return
+        entry[0]._emit(entry[1])
+        del entry
+
+
+# Background ToolObservers whose worker is still running, held weakly. The
+# worker is a daemon thread, so anything still queued at interpreter exit
+# would be lost; _drain_background_observers() flushes them first.
+_BACKGROUND_OBSERVERS: "weakref.WeakSet[ToolObserver]" = weakref.WeakSet()
+
+
+@atexit.register
+def _drain_background_observers() -> None:
+    for tool_observer in list(_BACKGROUND_OBSERVERS):
+        tool_observer._stop_worker()
 
 
 # Convenience decorator-style API
 def observe_tool(
     tool_name: str,
     subject_id: str,
-    observer: Optional[Observer] = None
-):
+    observer: Optional[Observer] = None,
+    hash_algorithm: str = "blake2b",
+    background: bool = False,
+    sample_rate: float = 1.0,
+) -> Callable[[Callable], Callable]:
     """
     Decorator to observe a tool/function.
     
@@ -180,17 +453,28 @@ def observe_tool(
         tool_name: Logical tool name
         subject_id: Agent/system invoking tool
         observer: Optional observer
+        hash_algorithm: "blake2b" (default) or "sha256" to reproduce the
+            input/result digests of older ledgers
+        background: Emit observations from a worker thread
+        sample_rate: Fraction of calls to observe (default 1.0)
     
     Returns:
-        Decorated function
+        Decorated function. Its tool_observer attribute is the ToolObserver
+        doing the recording — call wrapped.tool_observer.stop() to flush a
+        background queue before exit.
     """
     tool_observer = ToolObserver(
         tool_name=tool_name,
         subject_id=subject_id,
-        observer=observer
+        observer=observer,
+        hash_algorithm=hash_algorithm,
+        background=background,
+        sample_rate=sample_rate,
     )
     
     def decorator(fn: Callable) -> Callable:
-        return tool_observer.wrap(fn)
+        wrapped = tool_observer.wrap(fn)
+        wrapped.tool_observer = tool_observer
+        return wrapped
     
     return decorator
@@ -18,8 +18,6 @@ from typing import Optional
 
 import click
 
-from guardclaw.bundle.exporter import GEFBundleExporter, BundleExportError
-
 
 def _display_path(p: str) -> str:
     try:
@@ -84,6 +82,10 @@ def export_command(
       guardclaw export audit.gef --forensic --output case.gcbundle
       guardclaw export audit.gef --output ./evidence/ --format json
     """
+    # Imported per command so `guardclaw verify` / `--help` skip the
+    # bundle machinery at startup.
+    from guardclaw.bundle.exporter import GEFBundleExporter, BundleExportError
+
     ledger_path = Path(ledger)
     output_path = Path(output) if output else None
 
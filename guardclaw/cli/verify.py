@@ -17,6 +17,7 @@ Usage:
     guardclaw verify <ledger> --agent my-agent      Filter by agent_id
     guardclaw verify <ledger> --no-color            Disable ANSI
     guardclaw verify <ledger> --no-parallel         Force sequential
+    guardclaw verify <ledger> --fail-fast           Stop at first violation
 
     guardclaw verify case.gcbundle                  Verify a .gcbundle folder
 
@@ -31,17 +32,18 @@ Extension note:
     .gcbundle is a GuardClaw evidence bundle folder
 """
 
-import hashlib
 import json
 import sys
 import time
+from collections import Counter
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 import click
 
+from guardclaw.core.failure import compute_boundary_hash
+from guardclaw.core.jsonio import json_dumps_indent, json_loads
 from guardclaw.core.replay import ReplayEngine, ReplaySummary, ChainViolation
-from guardclaw import canonical_json_encode
 
 
 # ── GEF format detection (content-based, extension-agnostic) ─────────────────
@@ -69,7 +71,7 @@ def _detect_ledger_format(ledger_path: Path) -> Tuple[bool, bool]:
                 line = line.strip()
                 if not line:
                     continue
-                first_entry = json.loads(line)
+                first_entry = json_loads(line)
                 return is_gef_format(first_entry), is_recommended_ext
     except Exception:
         pass
@@ -93,36 +95,48 @@ def _is_bundle(path: Path) -> bool:
 
 # ── ANSI color ────────────────────────────────────────────────────────────────
 
-class _Color:
-    _on: bool = True
+def _ansi(code: str) -> Callable[[str], str]:
+    start = f"\033[{code}m"
 
-    @classmethod
-    def configure(cls, enabled: bool) -> None:
-        cls._on = enabled and sys.stdout.isatty()
+    def paint(s: str) -> str:
+        return f"{start}{s}\033[0m"
 
-    @classmethod
-    def green(cls, s: str) -> str:
-        return f"\033[32m{s}\033[0m" if cls._on else s
+    return paint
 
-    @classmethod
-    def red(cls, s: str) -> str:
-        return f"\033[31m{s}\033[0m" if cls._on else s
 
-    @classmethod
-    def yellow(cls, s: str) -> str:
-        return f"\033[33m{s}\033[0m" if cls._on else s
+def _identity(s: str) -> str:
+    return s
 
-    @classmethod
-    def cyan(cls, s: str) -> str:
-        return f"\033[36m{s}\033[0m" if cls._on else s
 
-    @classmethod
-    def bold(cls, s: str) -> str:
-        return f"\033[1m{s}\033[0m" if cls._on else s
+_PAINTERS = {
+    "green":  _ansi("32"),
+    "red":    _ansi("31"),
+    "yellow": _ansi("33"),
+    "cyan":   _ansi("36"),
+    "bold":   _ansi("1"),
+    "dim":    _ansi("2"),
+}
+
+
+class _Color:
+    """
+    configure() binds each color name to its painter or to _identity once,
+    so a call is a plain function call with no per-call _on check.
+    """
+    _on: bool = True
+
+    green  = staticmethod(_PAINTERS["green"])
+    red    = staticmethod(_PAINTERS["red"])
+    yellow = staticmethod(_PAINTERS["yellow"])
+    cyan   = staticmethod(_PAINTERS["cyan"])
+    bold   = staticmethod(_PAINTERS["bold"])
+    dim    = staticmethod(_PAINTERS["dim"])
 
     @classmethod
-    def dim(cls, s: str) -> str:
-        return f"\033[2m{s}\033[0m" if cls._on else s
+    def configure(cls, enabled: bool) -> None:
+        cls._on = enabled and sys.stdout.isatty()
+        for name, paint in _PAINTERS.items():
+            setattr(cls, name, staticmethod(paint if cls._on else _identity))
 
 
 def _row_ok(label: str, value: str) -> str:
@@ -144,29 +158,16 @@ def _compute_head_hash(engine: ReplayEngine) -> Tuple[Optional[str], Optional[in
     """
     head_hash = hex(SHA-256(JCS(signing_surface(last_entry))))
     NOT last_entry.causal_hash — commits to current state, not previous.
+
+    The signing surface is exactly to_signing_dict(), so this is the
+    locked boundary-hash formula — same bytes the signature and the next
+    causal_hash commit to, via the same canonical encoder.
     """
-    if not engine.envelopes:
+    if engine.head is None:
         return None, None
     try:
-        last = engine.envelopes[-1]
-        record_type = last.record_type
-        if hasattr(record_type, "value"):
-            record_type = record_type.value
-        signing_surface = {
-            "gef_version":       last.gef_version,
-            "record_id":         last.record_id,
-            "record_type":       record_type,
-            "agent_id":          last.agent_id,
-            "signer_public_key": last.signer_public_key,
-            "sequence":          last.sequence,
-            "nonce":             last.nonce,
-            "timestamp":         last.timestamp,
-            "causal_hash":       last.causal_hash,
-            "payload":           last.payload,
-        }
-        canonical_bytes = canonical_json_encode(signing_surface)
-        head_hash = hashlib.sha256(canonical_bytes).hexdigest()
-        return head_hash, last.sequence
+        last = engine.head
+        return compute_boundary_hash(last), last.sequence
     except Exception:
         return None, None
 
@@ -199,6 +200,8 @@ def _compute_head_hash(engine: ReplayEngine) -> Tuple[Optional[str], Optional[in
     help="Disable ANSI color output.")
 @click.option("--no-parallel", is_flag=True, default=False,
     help="Force sequential signature verification.")
+@click.option("--fail-fast", is_flag=True, default=False,
+    help="Stop at the first violation instead of checking every entry.")
 def verify_command(
     ledger:       str,
     fmt:          str,
@@ -208,6 +211,7 @@ def verify_command(
     agent:        Optional[str],
     no_color:     bool,
     no_parallel:  bool,
+    fail_fast:    bool,
 ) -> None:
     """
     Verify a GEF ledger — chain integrity, signatures, schema.
@@ -231,13 +235,16 @@ def verify_command(
     # Bundle metadata is shown as informational context in human output.
     bundle_mode = False
     bundle_root = None
-    if ledger_path.exists() and _is_bundle(ledger_path):
+    if _is_bundle(ledger_path):
         bundle_root = ledger_path
         ledger_path = ledger_path / "ledger.gef"
         bundle_mode = True
 
     # ── File check ────────────────────────────────────────────
-    if not ledger_path.exists():
+    # One stat() answers both "does it exist" and "how big is it".
+    try:
+        file_mb = ledger_path.stat().st_size / (1024 * 1024)
+    except OSError:
         _emit_error(f"Ledger not found: {ledger}", fmt, quiet)
         sys.exit(2)
 
@@ -264,13 +271,22 @@ def verify_command(
             sys.exit(2)
 
     # ── Load ──────────────────────────────────────────────────
-    file_mb  = ledger_path.stat().st_size / (1024 * 1024)
-    parallel = not no_parallel
+    # --fail-fast verifies each signature in order so it can stop early
+    parallel = not no_parallel and not fail_fast
     engine   = ReplayEngine(parallel=parallel, silent=True)
     t_start  = time.perf_counter()
 
+    # --agent / --range are applied while the ledger is parsed, so
+    # envelopes outside the filter are never kept.
+    predicate = None
+    if agent or range_start is not None:
+        def predicate(e) -> bool:
+            return (not agent or e.agent_id == agent) and (
+                range_start is None or range_start <= e.sequence < range_end
+            )
+
     try:
-        engine.load(ledger_path)
+        engine.load(ledger_path, predicate=predicate)
     except FileNotFoundError as e:
         _emit_error(str(e), fmt, quiet)
         sys.exit(2)
@@ -281,21 +297,7 @@ def verify_command(
         _emit_error(f"Unexpected error: {e}", fmt, quiet)
         sys.exit(2)
 
-    # ── Head hash BEFORE filtering ────────────────────────────
-    head_hash, head_sequence = _compute_head_hash(engine)
-
-    # ── Apply filters ─────────────────────────────────────────
-    original_count = len(engine.envelopes)
-
-    if agent:
-        engine.envelopes = [e for e in engine.envelopes if e.agent_id == agent]
-
-    if range_start is not None and range_end is not None:
-        engine.envelopes = [
-            e for e in engine.envelopes
-            if range_start <= e.sequence < range_end
-        ]
-
+    original_count = engine.loaded_count
     filtered     = original_count != len(engine.envelopes)
     active_count = len(engine.envelopes)
 
@@ -308,19 +310,25 @@ def verify_command(
 
     # ── Verify ────────────────────────────────────────────────
     try:
-        summary = engine.verify()
+        summary = engine.verify(fail_fast=fail_fast)
     except Exception as e:
         _emit_error(f"Verification error: {e}", fmt, quiet)
         sys.exit(2)
 
     t_elapsed = time.perf_counter() - t_start
-    rate      = active_count / t_elapsed if t_elapsed > 0 else 0
+    # --fail-fast may stop early; the rate covers only the entries checked
+    checked_count = (
+        summary.entries_checked if summary.entries_checked is not None
+        else active_count
+    )
+    rate      = checked_count / t_elapsed if t_elapsed > 0 else 0
     ledger_valid = len(summary.violations) == 0
 
     # ── Export ────────────────────────────────────────────────
     if export_path:
         try:
-            engine.export_json(Path(export_path))
+            # Reuse the summary above rather than verifying again
+            engine.export_json(Path(export_path), summary)
         except Exception as e:
             if not quiet and fmt == "human":
                 click.echo(_Color.yellow(f"\n  ⚠️   Export failed: {e}"), err=True)
@@ -329,6 +337,12 @@ def verify_command(
     if quiet:
         sys.exit(0 if ledger_valid else 1)
 
+    # ── Head hash over the whole ledger, not the filtered view ──
+    # Only the json and human reports print it.
+    head_hash, head_sequence = (
+        _compute_head_hash(engine) if fmt != "compact" else (None, None)
+    )
+
     if fmt == "json":
         _output_json(
             summary, ledger_path, file_mb, t_elapsed, rate,
@@ -370,158 +384,188 @@ def _output_human(
 ) -> None:
     BAR_HEAVY = "═" * 68
     BAR_LIGHT = "─" * 68
+    # Lines are collected and written with one click.echo() at the end —
+    # one write instead of ~40, and click still strips ANSI off a non-TTY.
+    lines: List[str] = []
+    echo = lines.append
 
-    click.echo()
-    click.echo(_Color.bold(f"  {BAR_HEAVY}"))
-    click.echo(_Color.bold(  "  GuardClaw  ·  GEF Ledger Verification"))
-    click.echo(_Color.bold(f"  {BAR_HEAVY}"))
-    click.echo()
+    echo("")
+    echo(_Color.bold(f"  {BAR_HEAVY}"))
+    echo(_Color.bold(  "  GuardClaw  ·  GEF Ledger Verification"))
+    echo(_Color.bold(f"  {BAR_HEAVY}"))
+    echo("")
 
     # ── Bundle metadata (informational) ──────────────────────
     if bundle_mode and bundle_root is not None:
         try:
             from guardclaw.bundle.models import BundleManifest
             manifest = BundleManifest.from_path(bundle_root / "manifest.json")
-            click.echo(_row_info("Bundle",   str(bundle_root)))
-            click.echo(_row_info("Created",  manifest.created_at))
-            click.echo(_row_info("SHA-256",  manifest.ledger_sha256[:32] + "..."))
-            click.echo(_row_info("Size",     f"{manifest.ledger_size_bytes:,} bytes"))
-            click.echo()
+            echo(_row_info("Bundle",   str(bundle_root)))
+            echo(_row_info("Created",  manifest.created_at))
+            echo(_row_info("SHA-256",  manifest.ledger_sha256[:32] + "..."))
+            echo(_row_info("Size",     f"{manifest.ledger_size_bytes:,} bytes"))
+            echo("")
         except Exception:
             pass  # Bundle metadata is informational — never fail verify on it
 
     # ── File info ─────────────────────────────────────────────
-    click.echo(_row_info("Ledger",
+    echo(_row_info("Ledger",
         str(ledger_path.name) if bundle_mode else str(ledger_path)
     ))
-    click.echo(_row_info("Size",
+    echo(_row_info("Size",
         f"{file_mb:.2f} MB  "
         f"({summary.total_entries:,} entries"
         + (f"  of {original_count:,} total" if filtered else "")
         + ")"
     ))
-    click.echo(_row_info("GEF version",
+    echo(_row_info("GEF version",
         f"v{summary.gef_version}" if summary.gef_version else "unknown"
     ))
-    click.echo(_row_info("Agents",
+    echo(_row_info("Agents",
         ", ".join(summary.agents_seen) if summary.agents_seen else "—"
     ))
     if filtered:
-        click.echo(_row_info("Filter", filter_note))
+        echo(_row_info("Filter", filter_note))
+    if summary.entries_checked is not None:
+        echo(_row_warn(
+            "Stopped",
+            _Color.yellow(f"after {summary.entries_checked:,} of "
+                          f"{summary.total_entries:,} entries (--fail-fast)")
+        ))
     if ext_warning:
-        click.echo(_row_warn(
+        echo(_row_warn(
             "Extension",
             _Color.yellow(f"'{ledger_path.suffix}' — GEF content detected. "
                           f"Rename to .gef for identity signalling.")
         ))
 
-    click.echo()
+    echo("")
 
     # ── Verification status ───────────────────────────────────
-    chain_v  = [v for v in summary.violations if v.violation_type == "chain_break"]
-    seq_v    = [v for v in summary.violations if v.violation_type == "sequence_gap"]
-    schema_v = [v for v in summary.violations if v.violation_type == "schema"]
+    # One pass over the violations; only the per-type counts are needed here
+    type_counts = Counter(v.violation_type for v in summary.violations)
+    chain_n  = type_counts["chain_break"]
+    seq_n    = type_counts["sequence_gap"]
+    schema_n = type_counts["schema"]
     total    = summary.total_entries
 
-    if not chain_v:
-        click.echo(_row_ok("Chain", "intact — all causal hashes valid"))
+    # --fail-fast stopped early: the checks below only cover entries 0..k
+    partial = summary.entries_checked is not None
+    checked = summary.entries_checked if partial else total
+    scope   = f"  (entries 0 → {checked - 1:,} only)" if partial else ""
+
+    if not chain_n:
+        echo(_row_ok("Chain",
+            ("intact — causal hashes valid" if partial
+             else "intact — all causal hashes valid") + scope
+        ))
     else:
-        click.echo(_row_fail("Chain", _Color.red(f"{len(chain_v)} break(s) detected")))
+        echo(_row_fail("Chain", _Color.red(f"{chain_n} break(s) detected")))
 
     if summary.invalid_signatures == 0:
-        click.echo(_row_ok("Signatures", f"{summary.valid_signatures:,} / {total:,} valid"))
+        echo(_row_ok("Signatures",
+            f"{summary.valid_signatures:,} / {checked:,} valid" + scope
+        ))
     else:
-        click.echo(_row_fail("Signatures",
+        echo(_row_fail("Signatures",
             f"{summary.valid_signatures:,} valid  "
             + _Color.red(f"{summary.invalid_signatures:,} INVALID")
         ))
 
-    if not schema_v:
-        click.echo(_row_ok("Schema", "all entries conform to GEF-SPEC-v1.0"))
+    if not schema_n:
+        echo(_row_ok("Schema",
+            ("entries conform to GEF-SPEC-v1.0" if partial
+             else "all entries conform to GEF-SPEC-v1.0") + scope
+        ))
     else:
-        click.echo(_row_fail("Schema", _Color.red(f"{len(schema_v)} violation(s)")))
-
-    if not seq_v:
-        if total > 0:
-            click.echo(_row_ok("Sequence", f"0 → {total - 1:,}  (no gaps)"))
+        echo(_row_fail("Schema", _Color.red(f"{schema_n} violation(s)")))
+
+    if not seq_n:
+        if partial:
+            echo(_row_ok("Sequence",
+                f"0 → {checked - 1:,}  (no gaps; rest not checked)"
+            ))
+        elif total > 0:
+            echo(_row_ok("Sequence", f"0 → {total - 1:,}  (no gaps)"))
         else:
-            click.echo(_row_ok("Sequence", "empty ledger"))
+            echo(_row_ok("Sequence", "empty ledger"))
     else:
-        click.echo(_row_fail("Sequence", _Color.red(f"{len(seq_v)} gap(s) detected")))
+        echo(_row_fail("Sequence", _Color.red(f"{seq_n} gap(s) detected")))
 
     if summary.gef_version:
-        click.echo(_row_ok("GEF version",
+        echo(_row_ok("GEF version",
             f"uniform — all entries at v{summary.gef_version}"
         ))
 
-    click.echo()
+    echo("")
 
     if summary.first_timestamp:
-        click.echo(_row_info("First entry",
+        echo(_row_info("First entry",
             f"{summary.first_timestamp}  " + _Color.dim("[seq 0]")
         ))
     if summary.last_timestamp:
-        click.echo(_row_info("Last entry",
+        echo(_row_info("Last entry",
             f"{summary.last_timestamp}  " + _Color.dim(f"[seq {total - 1:,}]")
         ))
 
     if head_hash and head_sequence is not None:
         short = head_hash[:16] + "..." + head_hash[-8:]
-        click.echo(_row_info("Chain Head",
+        echo(_row_info("Chain Head",
             _Color.cyan(short) + _Color.dim(f"  [seq {head_sequence}]")
         ))
-        click.echo(_row_info("",
+        echo(_row_info("",
             _Color.dim("hex(SHA-256(JCS(last_entry)))  ·  use for external anchoring")
         ))
 
-    click.echo()
+    echo("")
 
     if summary.record_type_counts:
         counts_str = "  ".join(
             f"{_Color.cyan(k)}: {v:,}"
             for k, v in sorted(summary.record_type_counts.items())
         )
-        click.echo(_row_info("Record types", counts_str))
+        echo(_row_info("Record types", counts_str))
 
     mode = "parallel" if parallel else "sequential"
-    click.echo(_row_info("Verified",
+    echo(_row_info("Verified",
         f"{elapsed:.3f}s  ·  {rate:,.0f} envelopes/sec  "
         + _Color.dim(f"({mode})")
     ))
 
     if export_path:
-        click.echo(_row_info("Exported", export_path))
+        echo(_row_info("Exported", export_path))
 
-    click.echo()
+    echo("")
 
     if summary.violations:
-        click.echo(f"  {BAR_LIGHT}")
-        click.echo(
+        echo(f"  {BAR_LIGHT}")
+        echo(
             f"  {_Color.bold(_Color.red('Seq')):>6}  "
             f"{_Color.bold(_Color.red('Type')):<22}  "
             f"{_Color.bold(_Color.red('Detail'))}"
         )
-        click.echo(f"  {BAR_LIGHT}")
+        echo(f"  {BAR_LIGHT}")
         for v in summary.violations:
-            click.echo(
+            echo(
                 f"  {_Color.red(str(v.at_sequence)):>6}  "
                 f"{_Color.yellow(f'{v.violation_type:<22}')}  {v.detail}"
             )
-        click.echo(f"  {BAR_LIGHT}")
-        click.echo()
+        echo(f"  {BAR_LIGHT}")
+        echo("")
 
-    click.echo(f"  {BAR_LIGHT}")
+    echo(f"  {BAR_LIGHT}")
     if ledger_valid:
-        click.echo(_Color.green(_Color.bold(
+        echo(_Color.green(_Color.bold(
             "  ✅  VALID  ·  0 violations  ·  ledger integrity confirmed"
         )))
     else:
         n = len(summary.violations)
-        click.echo(_Color.red(_Color.bold(
+        echo(_Color.red(_Color.bold(
             f"  ❌  INVALID  ·  {n} violation(s)  ·  ledger integrity compromised"
         )))
-    click.echo(f"  {BAR_LIGHT}")
-    click.echo()
+    echo(f"  {BAR_LIGHT}")
+    echo("")
+    click.echo("\n".join(lines))
 
 
 # ── JSON output ───────────────────────────────────────────────────────────────
@@ -547,6 +591,7 @@ def _output_json(
             "file_mb":                round(file_mb, 2),
             "gef_version":            summary.gef_version,
             "total_entries":          summary.total_entries,
+            "entries_checked":        summary.entries_checked,
             "original_count":         original_count,
             "filter_applied":         filtered,
             "filter":                 filter_note.strip() or None,
@@ -579,11 +624,15 @@ def _output_json(
             ],
         }
     }
-    click.echo(json.dumps(out, indent=2))
+    click.echo(json_dumps_indent(out))
 
 
 # ── Compact output ────────────────────────────────────────────────────────────
 
+_COMPACT_ENTRIES = "  {name:<30}  {entries:>10,} entries  "
+_COMPACT_TIMING  = "  {elapsed:.3f}s  {rate:,.0f}/sec"
+
+
 def _output_compact(
     summary:      ReplaySummary,
     ledger_path:  Path,
@@ -591,25 +640,25 @@ def _output_compact(
     rate:         float,
     ledger_valid: bool,
 ) -> None:
-    status  = "VALID"   if ledger_valid else "INVALID"
-    vcount  = len(summary.violations)
-    entries = summary.total_entries
-    name    = ledger_path.name
-
+    # Colors are applied to the fixed parts of the template only; the
+    # values go in with a single str.format call.
     if ledger_valid:
-        line = (
-            _Color.green(f"{status:<8}") +
-            f"  {name:<30}  {entries:>10,} entries  "
-            f"0 violations  {elapsed:.3f}s  {rate:,.0f}/sec"
+        template = (
+            _Color.green("VALID   ") + _COMPACT_ENTRIES
+            + "0 violations" + _COMPACT_TIMING
         )
     else:
-        line = (
-            _Color.red(f"{status:<8}") +
-            f"  {name:<30}  {entries:>10,} entries  "
-            f"{_Color.red(str(vcount) + ' violation(s)')}  "
-            f"{elapsed:.3f}s  {rate:,.0f}/sec"
+        template = (
+            _Color.red("INVALID ") + _COMPACT_ENTRIES
+            + _Color.red("{vcount} violation(s)") + _COMPACT_TIMING
         )
-    click.echo(line)
+    click.echo(template.format(
+        name=ledger_path.name,
+        entries=summary.total_entries,
+        vcount=len(summary.violations),
+        elapsed=elapsed,
+        rate=rate,
+    ))
 
 
 # ── Error output ──────────────────────────────────────────────────────────────
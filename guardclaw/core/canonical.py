@@ -5,6 +5,18 @@ This is the ONLY canonicalization permitted in GuardClaw.
 All signing, hashing, and chain computation MUST use this module.
 
 RFC 8785: https://www.rfc-editor.org/rfc/rfc8785
+
+FAST PATH:
+    When orjson is installed (pip install guardclaw[fast]), objects whose
+    JCS form is provably identical to orjson's sorted-key output are
+    encoded by orjson. That means: str keys that are pure ASCII (so UTF-16
+    and code-point ordering agree), and no floats or integers outside
+    ±2**53 (JCS renders those with ES6 number formatting). Everything else
+    goes through the reference `jcs` encoder. Output bytes never differ.
+
+    Decoding is the reader's concern: orjson.loads() silently turns integers
+    beyond 64 bits into floats, which would change the canonical bytes a
+    signature is checked against — see jsonio.json_loads() for the guard.
 """
 
 import hashlib
@@ -18,6 +30,50 @@ except ImportError as exc:
         f"Original error: {exc}"
     ) from exc
 
+# orjson is optional (None when absent) — jcs alone is always correct
+from guardclaw.core.jsonio import orjson as _orjson
+
+# Largest magnitude integer JCS emits as plain digits (IEEE-754 exact range)
+_MAX_SAFE_INT = 2 ** 53
+
+
+def _orjson_is_jcs(obj) -> bool:
+    """
+    True if orjson's OPT_SORT_KEYS output for obj is byte-identical to JCS.
+
+    Exact type checks on purpose: subclasses (IntEnum, str Enum, ...) go
+    through the reference encoder. So does any container reached twice —
+    a cycle would otherwise keep this walk going forever, and jcs raises
+    ValueError("Circular reference detected") for it.
+    """
+    stack = [obj]
+    pop, push = stack.pop, stack.append
+    seen = set()
+    while stack:
+        o = pop()
+        t = type(o)
+        if t is str or o is None or t is bool:
+            continue
+        if t is int:
+            if -_MAX_SAFE_INT <= o <= _MAX_SAFE_INT:
+                continue
+            return False
+        if t is dict or t is list or t is tuple:
+            if id(o) in seen:
+                return False
+            seen.add(id(o))
+        if t is dict:
+            for k, v in o.items():
+                if type(k) is not str or not k.isascii():
+                    return False
+                push(v)
+            continue
+        if t is list or t is tuple:
+            stack.extend(o)
+            continue
+        return False
+    return True
+
 
 def canonicalize(obj: dict) -> bytes:
     """
@@ -30,6 +86,11 @@ def canonicalize(obj: dict) -> bytes:
     Returns:
         UTF-8 encoded canonical JSON bytes, suitable for signing.
     """
+    if _orjson is not None and _orjson_is_jcs(obj):
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass  # e.g. lone surrogate or nesting depth — let jcs decide
     return _jcs.canonicalize(obj)
 
 
@@ -45,11 +106,8 @@ def canonical_hash(obj: dict) -> str:
     return hashlib.sha256(canonicalize(obj)).hexdigest()
 
 
-def canonical_json_encode(obj: dict) -> bytes:
-    """
-    Backward-compatibility alias for canonicalize().
-
-    Existing code importing canonical_json_encode continues to work.
-    New code should call canonicalize() directly.
-    """
-    return canonicalize(obj)
+# Backward-compatibility alias for canonicalize(). Bound to the same
+# function object (not a wrapper) because the signing and verification hot
+# paths still import this name — an extra Python frame per call adds up.
+# New code should call canonicalize() directly.
+canonical_json_encode = canonicalize
@@ -9,11 +9,13 @@ Key contracts:
     sign(data)              : bytes → base64url str, no padding
     verify_detached(...)    : @staticmethod — verifies with ONLY a pubkey hex string
                               This is the method models.py MUST call from verify_signature()
+                              (or its decoded-signature half, _verify_raw_signature())
     verify(...)             : instance method — verifies against THIS key manager's key
 
 CRITICAL:
     public_key_hex is a @property. Access as key.public_key_hex, NOT key.public_key_hex().
-    models.py verify_signature() MUST call Ed25519KeyManager.verify_detached(), not verify().
+    models.py verify_signature() MUST call Ed25519KeyManager.verify_detached()
+    (or _verify_raw_signature() after its own strict decode), not verify().
     verify() requires a key manager instance. verify_detached() requires only a hex string.
 
 SECURITY NOTE:
@@ -25,11 +27,23 @@ SECURITY NOTE:
 
     This prevents permissive decoder behavior from accepting non-canonical
     encodings such as '-' → '+' substitutions.
+
+BACKEND NOTE:
+    When PyNaCl is installed (pip install guardclaw[fast]), sign() and
+    verify_detached() run on libsodium's Ed25519. Otherwise the
+    `cryptography` backend is used. Both produce identical deterministic
+    RFC 8032 signatures — the backend never changes what is on the wire.
+    The backends disagree on degenerate inputs (libsodium refuses
+    small-order public keys and R values, OpenSSL accepts them), so those
+    are rejected here before either backend is called: a ledger verifies
+    the same whichever one is installed.
+    Key persistence (PEM save/load) always goes through `cryptography`.
 """
 
 import base64
 import binascii
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -44,6 +58,64 @@ from cryptography.hazmat.primitives.serialization import (
     PublicFormat,
 )
 
+try:
+    from nacl.signing import SigningKey as _NaclSigningKey
+    from nacl.signing import VerifyKey as _NaclVerifyKey
+    _HAVE_NACL = True
+except ImportError:  # PyNaCl is optional — fall back to `cryptography`
+    _HAVE_NACL = False
+
+
+# Field prime and the y-coordinates of the eight small-order Ed25519
+# points (identity, order 2, two of order 4 at y=0, four of order 8).
+# A public key or signature R on one of these can "verify" messages it
+# never signed; libsodium rejects them, `cryptography` does not.
+_ED25519_P = 2**255 - 19
+_SMALL_ORDER_Y = frozenset((
+    0,
+    1,
+    2707385501144840649318225287225658788936804267575313519463743609750303402022,
+    55188659117513257062467267217118295137698188065244968500265048394206261417927,
+    _ED25519_P - 1,
+))
+_Y_MASK = (1 << 255) - 1  # drop the x sign bit
+
+
+def _point_y(encoded: bytes) -> int:
+    """y-coordinate of an encoded Ed25519 point, not reduced mod p."""
+    return int.from_bytes(encoded, "little") & _Y_MASK
+
+
+@lru_cache(maxsize=1024)
+def _verify_key_from_hex(public_key_hex: str):
+    """
+    Parsed Ed25519 public key for public_key_hex, or None if it is not a
+    64-char lowercase hex encoding of a usable key. Non-canonical (y >= p)
+    and small-order keys are not usable, on either backend.
+
+    A ledger is normally signed by one key, so replay would otherwise
+    re-check and rebuild the same key object for every entry. The GEF
+    format checks run here too, so a repeat key costs one cache lookup.
+    Bounded so a ledger with many distinct signer keys cannot grow the
+    cache without limit.
+    """
+    if (
+        not isinstance(public_key_hex, str)
+        or len(public_key_hex) != 64
+        or public_key_hex.lower() != public_key_hex
+    ):
+        return None
+    try:
+        raw_pub = bytes.fromhex(public_key_hex)
+        y = _point_y(raw_pub)
+        if y >= _ED25519_P or y in _SMALL_ORDER_Y:
+            return None
+        if _HAVE_NACL:
+            return _NaclVerifyKey(raw_pub)
+        return Ed25519PublicKey.from_public_bytes(raw_pub)
+    except Exception:
+        return None
+
 
 class Ed25519KeyManager:
     """
@@ -73,6 +145,16 @@ class Ed25519KeyManager:
             .public_bytes(Encoding.Raw, PublicFormat.Raw)
             .hex()
         )
+        # libsodium signing key, built once from the same 32-byte seed
+        self._nacl_key = (
+            _NaclSigningKey(
+                private_key.private_bytes(
+                    Encoding.Raw, PrivateFormat.Raw, NoEncryption()
+                )
+            )
+            if _HAVE_NACL
+            else None
+        )
 
     # ── Construction ──────────────────────────────────────────
 
@@ -147,7 +229,10 @@ class Ed25519KeyManager:
         Returns:
             base64url-encoded signature, no padding. Always 86 characters.
         """
-        raw_sig = self._private_key.sign(data)
+        if self._nacl_key is not None:
+            raw_sig = self._nacl_key.sign(data).signature
+        else:
+            raw_sig = self._private_key.sign(data)
         return base64.urlsafe_b64encode(raw_sig).rstrip(b"=").decode("ascii")
 
     # ── Strict base64url decoding ─────────────────────────────
@@ -176,7 +261,7 @@ class Ed25519KeyManager:
         if not Ed25519KeyManager._B64URL_RE.fullmatch(signature_b64):
             raise ValueError("signature is not canonical base64url")
 
-        padded = signature_b64 + "=" * ((4 - len(signature_b64) % 4) % 4)
+        padded = signature_b64 + "=" * (-len(signature_b64) & 3)
 
         try:
             raw_sig = base64.urlsafe_b64decode(padded.encode("ascii"))
@@ -256,20 +341,37 @@ class Ed25519KeyManager:
             - Verification uses Ed25519 raw (not prehashed)
         """
         try:
-            if not isinstance(public_key_hex, str) or len(public_key_hex) != 64:
-                return False
+            raw_sig = Ed25519KeyManager._decode_strict_base64url_signature(signature_b64)
+        except ValueError:
+            return False
+        return Ed25519KeyManager._verify_raw_signature(data, raw_sig, public_key_hex)
 
-            if public_key_hex.lower() != public_key_hex:
-                return False
+    @staticmethod
+    def _verify_raw_signature(
+        data: bytes,
+        raw_sig: bytes,
+        public_key_hex: str,
+    ) -> bool:
+        """
+        verify_detached() for a signature the caller already decoded with
+        _decode_strict_base64url_signature().
 
-            raw_pub = bytes.fromhex(public_key_hex)
-            if len(raw_pub) != 32:
+        Callers that must tell "encoding" from "mismatch" failures decode
+        first anyway; this lets them hand over the raw 64 bytes instead of
+        paying for the strict decode (regex, b64 decode, re-encode) twice.
+        Same public key rules and the same never-raises contract.
+        """
+        try:
+            pub = _verify_key_from_hex(public_key_hex)
+            if pub is None:
                 return False
-
-            pub = Ed25519PublicKey.from_public_bytes(raw_pub)
-            raw_sig = Ed25519KeyManager._decode_strict_base64url_signature(signature_b64)
-
-            pub.verify(raw_sig, data)
+            # Small-order R (any encoding of it) — same rule on both backends
+            if _point_y(raw_sig[:32]) % _ED25519_P in _SMALL_ORDER_Y:
+                return False
+            if _HAVE_NACL:
+                pub.verify(data, raw_sig)
+            else:
+                pub.verify(raw_sig, data)
             return True
 
         except Exception:
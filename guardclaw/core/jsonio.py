@@ -0,0 +1,121 @@
+"""
+guardclaw/core/jsonio.py
+
+Plain JSON load/dump helpers, backed by orjson when it is installed
+(pip install guardclaw[fast]).
+
+Each helper returns exactly what the stdlib json call it stands in for
+would return — same objects, same text, same errors. orjson is only used
+where its result is known to be identical; everything else goes through
+stdlib json. This is NOT the signing encoder: canonical bytes come from
+guardclaw.core.canonical (RFC 8785) only.
+"""
+
+import json
+import re
+
+try:
+    import orjson
+except ImportError:  # orjson is optional — stdlib json gives the same results
+    orjson = None
+
+
+# orjson.loads() turns integers outside the 64-bit range into floats (and
+# from 19 digits up for negatives), which would change the JCS bytes a
+# signature is checked against. Any line with a 19-digit run is left to
+# stdlib json, which keeps ints exact.
+_LONG_DIGITS_STR = re.compile(r"[0-9]{19}")
+# Bytes lines (every file reader) take a faster scan than the regex: map
+# each digit to "0" and everything else to ".", then substring-search for
+# 19 zeros — two C loops, about a tenth of re.search() on ledger lines.
+_DIGIT_MASK = bytes(0x30 if 0x30 <= b <= 0x39 else 0x2E for b in range(256))
+_LONG_DIGITS_RUN = b"0" * 19
+
+
+def json_loads(raw):
+    """
+    json.loads() for one ledger line (str or UTF-8 bytes), via orjson when
+    the result is guaranteed identical.
+
+    Anything orjson rejects (NaN, lone surrogates, 1e400, ...) is re-parsed
+    by stdlib json, so accepted input and raised errors match json.loads().
+    Bytes are decoded as strict UTF-8 first, exactly as a text-mode read
+    would: json.loads() on bytes would also guess UTF-16/32 and skip a
+    leading BOM, which a UTF-8 ledger line must not do.
+    """
+    if orjson is not None:
+        if type(raw) is bytes:
+            long_digits = _LONG_DIGITS_RUN in raw.translate(_DIGIT_MASK)
+        else:
+            long_digits = _LONG_DIGITS_STR.search(raw) is not None
+        if not long_digits:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+    if type(raw) is bytes:
+        raw = raw.decode("utf-8")
+    return json.loads(raw)
+
+
+def json_dumps_indent(obj: dict) -> str:
+    """
+    json.dumps(obj, indent=2), built by orjson when it yields the same text.
+
+    orjson's OPT_INDENT_2 layout matches stdlib's indent=2, but it writes
+    non-ASCII characters and DEL raw where stdlib (ensure_ascii) escapes
+    them, so such output is re-rendered by stdlib json instead. Floats
+    differ only below 1e-4 or from 1e16 up; the reports written with this
+    hold only ints, strings and rounded timings/sizes, never either range.
+    """
+    if orjson is not None:
+        try:
+            out = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        else:
+            if out.isascii() and b"\x7f" not in out:
+                return out.decode("ascii")
+    return json.dumps(obj, indent=2)
+
+
+def _needs_stdlib(obj) -> bool:
+    """
+    True if obj holds a float (orjson and stdlib disagree on exponent
+    form, NaN and Infinity) or reaches a container twice (possibly a
+    cycle, which stdlib json reports as ValueError).
+    """
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    seen = set()
+    while stack:
+        o = pop()
+        if isinstance(o, float):
+            return True
+        if isinstance(o, (dict, list, tuple)):
+            if id(o) in seen:
+                return True
+            seen.add(id(o))
+            extend(o.values() if isinstance(o, dict) else o)
+    return False
+
+
+def json_dumps_line(obj: dict) -> bytes:
+    """
+    json.dumps(obj, separators=(",", ":")) + "\n" as UTF-8 bytes — one
+    compact JSONL record.
+
+    orjson builds the bytes directly when they are certain to match:
+    no floats, and ASCII-only output without DEL (stdlib's ensure_ascii
+    escapes both non-ASCII and DEL; orjson writes them raw). So a ledger's
+    bytes on disk never depend on whether orjson is installed.
+    """
+    if orjson is not None and not _needs_stdlib(obj):
+        try:
+            out = orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits, non-str keys
+        else:
+            if out.isascii() and b"\x7f" not in out:
+                return out
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
@@ -6,12 +6,13 @@ GEFLedger — the core truth store for GuardClaw.
 
 from __future__ import annotations
 
-import json
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from guardclaw.core.crypto import Ed25519KeyManager
+from guardclaw.core.crypto import _HAVE_NACL, Ed25519KeyManager
+from guardclaw.core.jsonio import json_dumps_line, json_loads
 from guardclaw.core.models import (
     ExecutionEnvelope,
     _VALID_RECORD_TYPES,
@@ -113,14 +114,105 @@ class GEFLedger:
 
             return env
 
+    def emit_batch(
+        self,
+        records: Iterable[Tuple[str, Dict[str, Any]]],
+        sign_workers: int = 1,
+    ) -> List[ExecutionEnvelope]:
+        """
+        Emit several (record_type, payload) pairs under one lock acquisition.
+
+        Every envelope is created and signed synchronously, exactly as in
+        emit() — signatures exist before this returns (GEF Section 7.1).
+        What is amortized is the lock round-trip and the file open/flush:
+        the whole batch is appended with a single write.
+
+        sign_workers > 1:
+            The chain dict excludes the signature, so every envelope is
+            linked and JCS-encoded first, on this thread, and only the raw
+            Ed25519 signatures are fanned out: the batch is split into
+            sign_workers contiguous slices, each signed on its own thread.
+            JCS runs under the GIL and the `cryptography` sign path is not
+            documented to release it, so this only takes effect with PyNaCl
+            (libsodium, whose cffi calls drop the GIL); otherwise the batch
+            is signed sequentially. Even then only the signing overlaps —
+            worth it for large batches on multi-core hosts.
+
+        All record_types are validated before anything is signed, so an
+        invalid entry rejects the batch without touching the chain.
+        """
+        records = list(records)
+        for record_type, _ in records:
+            if record_type not in _VALID_RECORD_TYPES:
+                raise ValueError(
+                    f"Invalid record_type '{record_type}'. "
+                    f"Valid: {sorted(_VALID_RECORD_TYPES)}"
+                )
+
+        parallel = _HAVE_NACL and sign_workers > 1 and len(records) > 1
+
+        with self._lock:
+            prev = self._chain[-1] if self._chain else None
+            signer_public_key = self._key_manager.public_key_hex
+            batch: List[ExecutionEnvelope] = []
+            # parallel: each envelope's canonical bytes, which link the next
+            # envelope now and are signed as-is by _sign_parallel()
+            canonical: List[bytes] = []
+
+            for record_type, payload in records:
+                prev = ExecutionEnvelope.create(
+                    record_type=record_type,
+                    agent_id=self._agent_id,
+                    signer_public_key=signer_public_key,
+                    sequence=len(self._chain) + len(batch),
+                    payload=payload,
+                    prev=prev,
+                    prev_chain_bytes=canonical[-1] if canonical else None,
+                )
+                if parallel:
+                    canonical.append(prev.canonical_bytes_for_signing())
+                else:
+                    prev.sign(self._key_manager)
+                batch.append(prev)
+
+            if parallel:
+                self._sign_parallel(batch, canonical, sign_workers)
+
+            self._chain.extend(batch)
+            self._persist_many(batch)
+
+            return batch
+
+    def _sign_parallel(
+        self, batch: List[ExecutionEnvelope], canonical: List[bytes], workers: int
+    ) -> None:
+        """Sign already-linked, already-encoded envelopes in contiguous slices, one per thread."""
+        key_manager = self._key_manager
+        step = -(-len(batch) // workers)
+
+        def _sign_slice(start: int) -> None:
+            for i in range(start, min(start + step, len(batch))):
+                batch[i].sign(key_manager, canonical_bytes=canonical[i])
+
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            # list() re-raises the first signing failure, if any
+            list(ex.map(_sign_slice, range(0, len(batch), step)))
+
     # ── Persistence ───────────────────────────────────────────
 
     def _persist(self, env: ExecutionEnvelope) -> None:
+        self._persist_many((env,))
+
+    def _persist_many(self, envs: Iterable[ExecutionEnvelope]) -> None:
         if self._ledger_file is None:
             return
 
-        with open(self._ledger_file, "a", encoding="utf-8", newline="") as f:
-            f.write(json.dumps(env.to_dict(), separators=(",", ":")) + "\n")
+        data = b"".join(json_dumps_line(env.to_dict()) for env in envs)
+        if not data:
+            return
+
+        with open(self._ledger_file, "ab") as f:
+            f.write(data)
             f.flush()
 
     # ── Crash Recovery ────────────────────────────────────────
@@ -156,14 +248,16 @@ class GEFLedger:
 
         self._chain = []
 
-        with open(self._ledger_file, "r", encoding="utf-8") as f:
+        # Binary lines: split in C, no text decoding; json takes UTF-8 bytes.
+        # Lines end at "\n" only and strip() drops ASCII whitespace only.
+        with open(self._ledger_file, "rb", buffering=1 << 20) as f:
             for line in f:
                 raw = line.strip()
                 if not raw:
                     continue
 
                 try:
-                    data = json.loads(raw)
+                    data = json_loads(raw)
                     env = ExecutionEnvelope.from_dict(data)
                 except Exception:
                     break
@@ -319,7 +319,7 @@ class AdminActionRecord:
         
         record = AdminActionRecord(
             action_id=action_id,
-            admin_key_id=admin_key_manager.public_key_hex(),
+            admin_key_id=admin_key_manager.public_key_hex,
             admin_identity=admin_identity,
             action_type=action_type,
             action_details=action_details,
@@ -83,8 +83,9 @@ CHANGE LOG:
 import hashlib
 import re
 import secrets
+import sys
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from guardclaw.core.canonical import canonical_json_encode
@@ -109,6 +110,11 @@ _TIMESTAMP_RE = re.compile(
     r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$"
 )
 
+
+def _intern(value: Any) -> Any:
+    """sys.intern() for str, passthrough for anything else (schema check reports it)."""
+    return sys.intern(value) if type(value) is str else value
+
 # ─────────────────────────────────────────────────────────────
 # Exceptions
 # ─────────────────────────────────────────────────────────────
@@ -191,7 +197,15 @@ class SchemaValidationResult:
 # ExecutionEnvelope — THE ONLY GEF LEDGER ENTRY TYPE
 # ─────────────────────────────────────────────────────────────
 
-@dataclass
+# One envelope per ledger entry — slots drop the per-instance __dict__.
+# weakref_slot keeps envelopes weak-referenceable, and only exists from
+# Python 3.11; older versions keep a regular dataclass.
+_ENVELOPE_DATACLASS_KWARGS = (
+    {"slots": True, "weakref_slot": True} if sys.version_info >= (3, 11) else {}
+)
+
+
+@dataclass(**_ENVELOPE_DATACLASS_KWARGS)
 class ExecutionEnvelope:
     """
     The singular GEF ledger entry. No other ledger type exists.
@@ -211,6 +225,12 @@ class ExecutionEnvelope:
     payload:            Dict[str, Any]
     signature:          Optional[str] = None
 
+    # Canonical bytes covered by `signature`, captured by sign(). Not part
+    # of any protocol contract — never serialized, compared, or verified.
+    _signed_bytes:      Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
     # ── Constructor ───────────────────────────────────────────
 
     @classmethod
@@ -222,10 +242,14 @@ class ExecutionEnvelope:
         sequence:          int,
         payload:           Dict[str, Any],
         prev:              Optional["ExecutionEnvelope"] = None,
+        prev_chain_bytes:  Optional[bytes] = None,
     ) -> "ExecutionEnvelope":
         """
         Create an unsigned ExecutionEnvelope with correct causal_hash.
 
+        prev_chain_bytes: prev.canonical_bytes_for_signing(), if the caller
+        already has it — saves a JCS pass when prev is not yet signed.
+
         Hard enforces:
             record_type       — must be in _VALID_RECORD_TYPES
             payload           — must be a dict
@@ -274,7 +298,9 @@ class ExecutionEnvelope:
             sequence          = sequence,
             nonce             = secrets.token_hex(_NONCE_HEX_LENGTH // 2),
             timestamp         = gef_timestamp(),
-            causal_hash       = cls._compute_causal_hash(prev),
+            causal_hash       = cls._compute_causal_hash(
+                prev, reuse_signed_bytes=True, prev_chain_bytes=prev_chain_bytes,
+            ),
             payload           = payload,
             signature         = None,
         )
@@ -292,12 +318,15 @@ class ExecutionEnvelope:
             "unknown record_type injected post-write" (schema violation)
         vs "field missing entirely"                   (KeyError from from_dict)
         """
+        # Low-cardinality fields are interned: every parsed JSONL line
+        # otherwise carries its own copy of "1.0", the record_type, the
+        # agent_id and the signer key. Uniques (ids, nonces, hashes) are not.
         return cls(
-            gef_version       = data["gef_version"],
+            gef_version       = _intern(data["gef_version"]),
             record_id         = data["record_id"],
-            record_type       = data["record_type"],
-            agent_id          = data["agent_id"],
-            signer_public_key = data["signer_public_key"],
+            record_type       = _intern(data["record_type"]),
+            agent_id          = _intern(data["agent_id"]),
+            signer_public_key = _intern(data["signer_public_key"]),
             sequence          = data["sequence"],
             nonce             = data["nonce"],
             timestamp         = data["timestamp"],
@@ -480,7 +509,7 @@ class ExecutionEnvelope:
         Full serialization including signature. Used for JSONL persistence ONLY.
         Not used for signing. Not used for chain hashing.
         """
-        d = self.to_signing_dict().copy()
+        d = self.to_signing_dict()  # already a fresh dict — no copy needed
         d["signature"] = self.signature
         return d
 
@@ -502,6 +531,8 @@ class ExecutionEnvelope:
     @staticmethod
     def _compute_causal_hash(
         prev: Optional["ExecutionEnvelope"],
+        reuse_signed_bytes: bool = False,
+        prev_chain_bytes: Optional[bytes] = None,
     ) -> str:
         """
         THE ONLY place SHA-256 is computed over chain data in this codebase.
@@ -511,50 +542,98 @@ class ExecutionEnvelope:
 
         Called only by create(). All chain verification goes through
         expected_causal_hash_from() which calls this.
+
+        reuse_signed_bytes (create() only):
+            to_chain_dict() == to_signing_dict(), so the bytes sign() fed to
+            Ed25519 ARE prev's chain bytes — exactly what was persisted.
+            Hashing them skips a second JCS pass per emitted envelope.
+            Verification never sets this: it always re-encodes live fields
+            so in-memory mutation after sign() is still detected.
+
+        prev_chain_bytes (verification, batch emit):
+            canonical_json_encode(prev.to_chain_dict()) already computed by
+            the caller from prev's current fields — e.g. the bytes replay
+            just verified prev's signature over. Used as-is.
+
+        Single one-shot update: hashlib releases the GIL for inputs of
+        2 KiB or more, so large payloads overlap with other threads.
         """
         if prev is None:
             return GENESIS_HASH
-        return hashlib.sha256(
-            canonical_json_encode(prev.to_chain_dict())
-        ).hexdigest()
+        if prev_chain_bytes is not None:
+            chain_bytes = prev_chain_bytes
+        elif reuse_signed_bytes and prev._signed_bytes is not None:
+            chain_bytes = prev._signed_bytes
+        else:
+            chain_bytes = canonical_json_encode(prev.to_chain_dict())
+        return hashlib.sha256(chain_bytes).hexdigest()
 
     def expected_causal_hash_from(
-        self, prev: Optional["ExecutionEnvelope"]
+        self,
+        prev: Optional["ExecutionEnvelope"],
+        prev_chain_bytes: Optional[bytes] = None,
     ) -> str:
         """
         What this entry's causal_hash SHOULD be given its predecessor.
         Used by replay and verification — not by the emitter.
         """
-        return ExecutionEnvelope._compute_causal_hash(prev)
+        return ExecutionEnvelope._compute_causal_hash(
+            prev, prev_chain_bytes=prev_chain_bytes
+        )
 
     # ── Signing ───────────────────────────────────────────────
 
-    def sign(self, key_manager) -> "ExecutionEnvelope":
+    def sign(
+        self, key_manager, canonical_bytes: Optional[bytes] = None
+    ) -> "ExecutionEnvelope":
         """
         Sign this envelope in-place. Returns self for chaining.
 
         Computes canonical_bytes_for_signing() and calls key_manager.sign().
         Stores base64url (no-padding) Ed25519 signature in self.signature.
 
+        canonical_bytes: canonical_bytes_for_signing() already computed by
+        the caller from the current fields. Used as-is.
+
         Pattern:
             env = ExecutionEnvelope.create(...).sign(key_manager)
 
         Never call on an already-signed envelope — previous signature
         will be silently overwritten.
         """
-        self.signature = key_manager.sign(self.canonical_bytes_for_signing())
+        data = (
+            canonical_bytes if canonical_bytes is not None
+            else self.canonical_bytes_for_signing()
+        )
+        self.signature     = key_manager.sign(data)
+        self._signed_bytes = data
         return self
 
+    @property
+    def signed_bytes(self) -> Optional[bytes]:
+        """
+        The exact canonical bytes passed to key_manager.sign(), as of sign().
+
+        Saves emitters a second JCS pass. None for envelopes that were not
+        signed in this process (e.g. loaded via from_dict()).
+
+        NOT a verification input — verify_signature() always recomputes
+        canonical_bytes_for_signing() so post-sign mutation is detected.
+        """
+        return self._signed_bytes
+
     # ── Verification ──────────────────────────────────────────
 
     def verify_signature(
         self,
         override_public_key_hex: Optional[str] = None,
+        canonical_bytes: Optional[bytes] = None,
     ) -> Tuple[bool, str]:
         """
         Verify the Ed25519 signature over canonical_bytes_for_signing().
 
-        Uses Ed25519KeyManager.verify_detached() — a @staticmethod that
+        Uses Ed25519KeyManager's static verify path (verify_detached()
+        semantics, fed the already-decoded signature) — a @staticmethod that
         requires only a public key hex string. No key manager instance needed.
         This is the ONLY correct way to verify from an envelope, because
         the envelope stores only signer_public_key (hex), not a key manager.
@@ -563,6 +642,11 @@ class ExecutionEnvelope:
             override_public_key_hex: Verify against a different public key.
                                      Used by tests to confirm wrong keys fail.
                                      Defaults to self.signer_public_key.
+            canonical_bytes:         canonical_bytes_for_signing() as just
+                                     computed by the caller, so one JCS pass
+                                     can serve both this check and the next
+                                     entry's causal hash. Never pass bytes
+                                     saved before a possible mutation.
 
         Returns:
             (True,  "")           — signature valid over current canonical bytes
@@ -588,24 +672,29 @@ class ExecutionEnvelope:
 
         # Step 1 — strict encoding check before cryptographic verification
         try:
-            Ed25519KeyManager._decode_strict_base64url_signature(self.signature)
+            raw_sig = Ed25519KeyManager._decode_strict_base64url_signature(self.signature)
         except ValueError:
             return False, "encoding"
 
-        # Step 2 — cryptographic verification
-        data = self.canonical_bytes_for_signing()
-        ok   = Ed25519KeyManager.verify_detached(data, self.signature, pubkey_hex)
+        # Step 2 — cryptographic verification (signature already decoded)
+        data = canonical_bytes if canonical_bytes is not None else self.canonical_bytes_for_signing()
+        ok   = Ed25519KeyManager._verify_raw_signature(data, raw_sig, pubkey_hex)
         return (True, "") if ok else (False, "mismatch")
 
     def verify_chain(
-        self, prev: Optional["ExecutionEnvelope"]
+        self,
+        prev: Optional["ExecutionEnvelope"],
+        prev_chain_bytes: Optional[bytes] = None,
     ) -> bool:
         """
         Verify this entry's causal_hash is correct given its predecessor.
         Delegates entirely to expected_causal_hash_from() — no local hash logic.
         Returns False if causal_hash doesn't match what it should be.
+
+        prev_chain_bytes: prev's canonical chain bytes, if the caller
+        already has them (see _compute_causal_hash).
         """
-        return self.causal_hash == self.expected_causal_hash_from(prev)
+        return self.causal_hash == self.expected_causal_hash_from(prev, prev_chain_bytes)
 
     def verify_sequence(self, expected: int) -> bool:
         """Return True if self.sequence == expected."""
@@ -5,6 +5,7 @@ GuardClaw GEF: Ghost and Strict Modes.
 import os
 import warnings
 import json
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -88,7 +89,6 @@ class ModeManager:
     def validate_expiry(self, valid_from: str, valid_until: str, current_time: str) -> None:
         if not self.config.enforce_expiry:
             return
-        from datetime import datetime, timezone
         vf = datetime.fromisoformat(valid_from.replace("Z", "+00:00"))
         vu = datetime.fromisoformat(valid_until.replace("Z", "+00:00"))
         now = datetime.fromisoformat(current_time.replace("Z", "+00:00"))
@@ -54,12 +54,14 @@ from __future__ import annotations
 
 import json
 import os
+import re
+import sys
 import time
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set, Tuple
 
 from guardclaw.core.failure import (
     FailureDetail,
@@ -69,6 +71,7 @@ from guardclaw.core.failure import (
     compute_boundary_hash,
     first_schema_error,
 )
+from guardclaw.core.jsonio import json_dumps_indent, json_loads
 from guardclaw.core.models import (
     ExecutionEnvelope,
     GEFVersionError,
@@ -79,29 +82,79 @@ from guardclaw.core.models import (
 
 
 def _verify_sig_batch(
-    batch: List[Tuple[Dict[str, Any], Optional[str], str, int]]
+    batch: List[Tuple[bytes, Optional[str], str, int]]
 ) -> List[Tuple[int, bool, str]]:
-    from guardclaw.core.canonical import canonical_json_encode
     from guardclaw.core.crypto import Ed25519KeyManager
     results: List[Tuple[int, bool, str]] = []
-    for signing_dict, signature, pubkey_hex, sequence in batch:
+    for data, signature, pubkey_hex, sequence in batch:
         if not signature:
             results.append((sequence, False, "mismatch"))
             continue
         try:
-            Ed25519KeyManager._decode_strict_base64url_signature(signature)
+            raw_sig = Ed25519KeyManager._decode_strict_base64url_signature(signature)
         except ValueError:
             results.append((sequence, False, "encoding"))
             continue
-        data = canonical_json_encode(signing_dict)
-        ok = Ed25519KeyManager.verify_detached(data, signature, pubkey_hex)
+        ok = Ed25519KeyManager._verify_raw_signature(data, raw_sig, pubkey_hex)
         results.append((sequence, ok, "" if ok else "mismatch"))
     return results
 
 
+# Exactly the form create() emits: 32 lowercase hex digits, nothing else.
+_CANONICAL_NONCE = re.compile(r"[0-9a-f]{32}")
+
+
+def _nonce_key(nonce: Any) -> Any:
+    """
+    Compact, exact seen-nonce set key.
+
+    Nonces in create()'s form (32 lowercase hex digits) are stored as their
+    128-bit int: about half the memory of the 32-char str a streamed
+    ledger would otherwise keep alive per entry, and a cheaper hash.
+    Other strings — other case, embedded spaces (bytes.fromhex() accepts
+    them) — are kept as-is. Non-str values, which reach here on the paths
+    that skip validate_schema(), are wrapped as ("raw", value) so an int
+    nonce 255 cannot collide with the int key of hex "000…0ff". The three
+    key shapes never compare equal to each other, so duplicate detection
+    is exact: no hash truncation, no false positives.
+    """
+    if type(nonce) is str:
+        if _CANONICAL_NONCE.fullmatch(nonce):
+            return int(nonce, 16)
+        return nonce
+    return ("raw", nonce)
+
+
 _PARALLEL_THRESHOLD = 2_000
 _BATCH_SIZE_PER_WORKER_MULTIPLIER = 4
 _STREAM_PROGRESS_INTERVAL = 100_000
+_LOAD_BUFFER_SIZE = 1 << 20
+_TIMELINE_FLUSH_EVERY = 1024
+# bool → timeline status label, indexed directly in the render loop
+_TIMELINE_STATUS = ("FAIL", "OK")
+
+
+def _open_ledger(ledger_path: Path) -> BinaryIO:
+    """
+    Open a ledger for one front-to-back pass of binary line iteration.
+
+    1 MiB buffer; on POSIX the kernel is also told the access is
+    sequential, which widens readahead for cold (uncached) ledgers. The
+    hint is advisory — any failure to apply it is ignored.
+
+    Binary lines end at "\n" only, and callers strip them with
+    bytes.strip(), which removes ASCII whitespace only. So unlike the
+    text-mode reads this replaced, a lone "\r" does not end a line and
+    Unicode whitespace (e.g. NBSP) around an entry is not stripped —
+    ledgers are written as "\n"-terminated compact JSON, never either.
+    """
+    f = open(ledger_path, "rb", buffering=_LOAD_BUFFER_SIZE)
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return f
 
 
 @dataclass
@@ -124,6 +177,11 @@ class ReplaySummary:
     gef_version: Optional[str]
     first_timestamp: Optional[str]
     last_timestamp: Optional[str]
+    # Set only when verify(fail_fast=True) stopped early: entries checked,
+    # counting the one that failed. Violations and signature counts then
+    # cover those entries only; total_entries, record_type_counts,
+    # agents_seen and the timestamps still cover every loaded entry.
+    entries_checked: Optional[int] = None
 
 
 class ReplayEngine:
@@ -137,6 +195,11 @@ class ReplayEngine:
         self._parallel: bool = parallel
         self._silent: bool = silent
         self._out_of_order: List[Tuple[int, int, str]] = []
+        # Set by load(): the entry that is last in sequence order across
+        # the whole file, and how many entries the file held — both
+        # independent of any load() predicate.
+        self.head: Optional[ExecutionEnvelope] = None
+        self.loaded_count: int = 0
 
     # -- PRIMARY API ------------------------------------------------------
 
@@ -170,14 +233,15 @@ class ReplayEngine:
 
     def _stream_verify_strict(self, ledger_path: Path) -> VerificationSummary:
         prev: Optional[ExecutionEnvelope] = None
+        prev_bytes: Optional[bytes] = None
         gef_version: Optional[str] = None
-        seen_nonces: Set[str] = set()
+        seen_nonces: Set[Any] = set()
         seen_record_ids: Set[str] = set()
         verified = 0
         entry_count = 0
         expected_seq = 0
 
-        with open(ledger_path, "r", encoding="utf-8") as f:
+        with _open_ledger(ledger_path) as f:
             for line_num, raw in enumerate(f):
                 raw = raw.strip()
                 if not raw:
@@ -187,7 +251,7 @@ class ReplayEngine:
 
                 # 1. JSON decode
                 try:
-                    data = json.loads(raw)
+                    data = json_loads(raw)
                 except json.JSONDecodeError:
                     return VerificationSummary(
                         total_entries=entry_count,
@@ -250,7 +314,10 @@ class ReplayEngine:
                     )
 
                 # 6+7. Signature encoding + crypto  <- TRUST BOUNDARY
-                sig_ok, sig_reason = env.verify_signature()
+                # One JCS pass serves the signature check here and, once
+                # this entry is accepted, the next entry's causal hash.
+                canonical = env.canonical_bytes_for_signing()
+                sig_ok, sig_reason = env.verify_signature(canonical_bytes=canonical)
                 if not sig_ok:
                     return VerificationSummary(
                         total_entries=entry_count,
@@ -302,7 +369,7 @@ class ReplayEngine:
                     )
 
                 # 11. Causal hash
-                if not env.verify_chain(prev):
+                if not env.verify_chain(prev, prev_bytes):
                     return VerificationSummary(
                         total_entries=entry_count,
                         chain_valid=False,
@@ -312,7 +379,8 @@ class ReplayEngine:
                     )
 
                 # 12. Nonce uniqueness
-                if env.nonce in seen_nonces:
+                nonce_key = _nonce_key(env.nonce)
+                if nonce_key in seen_nonces:
                     return VerificationSummary(
                         total_entries=entry_count,
                         chain_valid=False,
@@ -320,9 +388,10 @@ class ReplayEngine:
                         failure_type=FailureType.CHAIN_VIOLATION,
                         failure_detail=FailureDetail.DUPLICATE_NONCE,
                     )
-                seen_nonces.add(env.nonce)
+                seen_nonces.add(nonce_key)
 
                 prev = env
+                prev_bytes = canonical
                 verified += 1
                 expected_seq += 1
 
@@ -336,9 +405,10 @@ class ReplayEngine:
 
     def _stream_verify_recovery(self, ledger_path: Path) -> VerificationSummary:
         prev: Optional[ExecutionEnvelope] = None
+        prev_bytes: Optional[bytes] = None
         last_valid: Optional[ExecutionEnvelope] = None
         gef_version: Optional[str] = None
-        seen_nonces: Set[str] = set()
+        seen_nonces: Set[Any] = set()
         seen_record_ids: Set[str] = set()
         verified = 0
         entry_count = 0
@@ -359,7 +429,7 @@ class ReplayEngine:
                 boundary_sequence=last_valid.sequence if last_valid else None,
             )
 
-        with open(ledger_path, "r", encoding="utf-8") as f:
+        with _open_ledger(ledger_path) as f:
             for line_num, raw in enumerate(f):
                 raw = raw.strip()
                 if not raw:
@@ -369,7 +439,7 @@ class ReplayEngine:
 
                 # 1. JSON decode
                 try:
-                    data = json.loads(raw)
+                    data = json_loads(raw)
                 except json.JSONDecodeError:
                     return _fail(
                         line_num,
@@ -420,7 +490,10 @@ class ReplayEngine:
                     )
 
                 # 6+7. Signature encoding + crypto  <- TRUST BOUNDARY
-                sig_ok, sig_reason = env.verify_signature()
+                # One JCS pass serves the signature check here and, once
+                # this entry is accepted, the next entry's causal hash.
+                canonical = env.canonical_bytes_for_signing()
+                sig_ok, sig_reason = env.verify_signature(canonical_bytes=canonical)
                 if not sig_ok:
                     return _fail(
                         line_num,
@@ -460,7 +533,7 @@ class ReplayEngine:
                     )
 
                 # 11. Causal hash
-                if not env.verify_chain(prev):
+                if not env.verify_chain(prev, prev_bytes):
                     return _fail(
                         line_num,
                         FailureType.CHAIN_VIOLATION,
@@ -468,16 +541,18 @@ class ReplayEngine:
                     )
 
                 # 12. Nonce uniqueness
-                if env.nonce in seen_nonces:
+                nonce_key = _nonce_key(env.nonce)
+                if nonce_key in seen_nonces:
                     return _fail(
                         line_num,
                         FailureType.CHAIN_VIOLATION,
                         FailureDetail.DUPLICATE_NONCE,
                     )
-                seen_nonces.add(env.nonce)
+                seen_nonces.add(nonce_key)
 
                 last_valid = env
                 prev = env
+                prev_bytes = canonical
                 verified += 1
                 expected_seq += 1
 
@@ -491,23 +566,47 @@ class ReplayEngine:
 
     # -- LEGACY: load() + verify() ----------------------------------------
 
-    def load(self, ledger_path: Path) -> None:
+    def load(
+        self,
+        ledger_path: Path,
+        predicate: Optional[Callable[[ExecutionEnvelope], bool]] = None,
+    ) -> None:
+        """
+        Parse and schema-check every entry of ledger_path into self.envelopes.
+
+        predicate, if given, is applied as each entry is parsed and only
+        matching envelopes are kept — filtering in the same pass instead of
+        materializing every envelope first. Every line is still parsed and
+        validated, and reorder detection, the gef_version check, head and
+        loaded_count still cover the whole file.
+        """
         ledger_path = Path(ledger_path)
         self._ledger_path = ledger_path
         self.envelopes = []
         self.violations = []
         self._out_of_order = []
+        self.head = None
+        self.loaded_count = 0
 
         if not ledger_path.exists():
             raise FileNotFoundError(f"GEF ledger not found: {ledger_path}")
 
-        with open(ledger_path, "r", encoding="utf-8") as f:
+        # Binary line iteration over a 1 MiB buffer: lines are split in C
+        # with no text decoding, and only one buffer of the file is held at
+        # a time — memory is bounded by the envelopes kept, not the file.
+        # json_loads() takes the UTF-8 bytes directly.
+        kept = self.envelopes
+        out_of_order = self._out_of_order
+        head: Optional[ExecutionEnvelope] = None
+        versions: Set[str] = set()
+        fp = 0
+        with _open_ledger(ledger_path) as f:
             for line_num, raw in enumerate(f, 1):
                 raw = raw.strip()
                 if not raw:
                     continue
                 try:
-                    data = json.loads(raw)
+                    data = json_loads(raw)
                 except json.JSONDecodeError as exc:
                     raise ValueError(f"Malformed JSON at line {line_num}: {exc}") from exc
                 try:
@@ -520,45 +619,69 @@ class ReplayEngine:
                         f"Schema violation at line {line_num} "
                         f"(record_id={data.get('record_id', '?')}): {schema.errors}"
                     )
-                self.envelopes.append(env)
-
-        self._out_of_order = [
-            (fp, env.sequence, env.record_id)
-            for fp, env in enumerate(self.envelopes)
-            if env.sequence != fp
-        ]
-        self.envelopes.sort(key=lambda e: e.sequence)
-
-        if self.envelopes:
-            versions = {e.gef_version for e in self.envelopes}
-            if len(versions) > 1:
-                raise GEFVersionError(
-                    f"Mixed gef_version in '{ledger_path.name}': {sorted(versions)}"
-                )
+                if env.sequence != fp:
+                    out_of_order.append((fp, env.sequence, env.record_id))
+                # >= : the stable sort below leaves the later of equal
+                # sequences last, so the head must follow file order too.
+                if head is None or env.sequence >= head.sequence:
+                    head = env
+                versions.add(env.gef_version)
+                fp += 1
+                if predicate is None or predicate(env):
+                    kept.append(env)
+
+        # No entry off its file position means the list is already in
+        # sequence order — skip the sort entirely (the normal case).
+        if out_of_order:
+            kept.sort(key=attrgetter("sequence"))
+
+        if len(versions) > 1:
+            raise GEFVersionError(
+                f"Mixed gef_version in '{ledger_path.name}': {sorted(versions)}"
+            )
+        self.head = head
+        self.loaded_count = fp
 
         if not self._silent:
             print(f"Loaded {len(self.envelopes):,} GEF envelopes from '{ledger_path.name}'")
 
-    def verify(self) -> ReplaySummary:
+    def verify(self, fail_fast: bool = False) -> ReplaySummary:
+        """
+        Verify the loaded envelopes: sequence, causal chain, nonces, agent
+        consistency and Ed25519 signatures.
+
+        fail_fast=True checks each signature inline with its chain checks
+        and stops at the first entry with any violation, so a ledger
+        tampered at entry k costs k verifies instead of N. Violations and
+        signature counts then cover entries 0..k only and entries_checked
+        is set; record counts, agents and timestamps need no crypto and
+        still cover every loaded entry. File reorders are detected at load
+        time and reported without stopping the run.
+        """
         self.violations = []
         if not self.envelopes:
             return self._empty_summary()
 
         chain_violations: List[ChainViolation] = []
-        seen_nonces: Set[str] = set()
-
-        for fp, actual_seq, rec_id in self._out_of_order:
-            chain_violations.append(
-                ChainViolation(
-                    at_sequence=actual_seq,
-                    record_id=rec_id,
-                    violation_type="sequence_order",
-                    detail=f"File position {fp} has sequence {actual_seq} -- reorder detected.",
-                )
-            )
+        seen_nonces: Set[Any] = set()
+
+        # One JCS pass per entry: its bytes check the next entry's causal
+        # hash here and its own signature below.
+        canonical: List[bytes] = []
+        prev_bytes: Optional[bytes] = None
+        counts: Dict[str, int] = defaultdict(int)
+        agents: Set[str] = set()
+        sig_results: Dict[int, Tuple[bool, str]] = {}
+        checked = len(self.envelopes)
+        expected_agent = self.envelopes[0].agent_id
 
         for i, env in enumerate(self.envelopes):
+            violations_before = len(chain_violations)
             prev = self.envelopes[i - 1] if i > 0 else None
+            env_bytes = env.canonical_bytes_for_signing()
+            canonical.append(env_bytes)
+            counts[env.record_type] += 1
+            agents.add(env.agent_id)
             if not env.verify_sequence(i):
                 chain_violations.append(
                     ChainViolation(
@@ -568,7 +691,7 @@ class ReplayEngine:
                         detail=f"Expected sequence {i}, got {env.sequence}",
                     )
                 )
-            if not env.verify_chain(prev):
+            if not env.verify_chain(prev, prev_bytes):
                 from guardclaw.core.models import GENESIS_HASH as _GENESIS_HASH
                 expected = _GENESIS_HASH if prev is None else compute_boundary_hash(prev)
                 chain_violations.append(
@@ -582,7 +705,8 @@ class ReplayEngine:
                         ),
                     )
                 )
-            if env.nonce in seen_nonces:
+            nonce_key = _nonce_key(env.nonce)
+            if nonce_key in seen_nonces:
                 chain_violations.append(
                     ChainViolation(
                         at_sequence=env.sequence,
@@ -591,34 +715,71 @@ class ReplayEngine:
                         detail=f"Duplicate nonce '{env.nonce}' at seq {env.sequence} (INV-29)",
                     )
                 )
-            seen_nonces.add(env.nonce)
-
-        if self.envelopes:
-            expected_agent = self.envelopes[0].agent_id
-            for env in self.envelopes[1:]:
-                if env.agent_id != expected_agent:
-                    chain_violations.append(
-                        ChainViolation(
-                            at_sequence=env.sequence,
-                            record_id=env.record_id,
-                            violation_type="mixed_agent_id",
-                            detail=(
-                                f"agent_id changed from '{expected_agent}' "
-                                f"to '{env.agent_id}' at seq {env.sequence}."
-                            ),
-                        )
-                    )
+            seen_nonces.add(nonce_key)
+            prev_bytes = env_bytes
+
+            if fail_fast:
+                sig_results[env.sequence] = env.verify_signature(canonical_bytes=env_bytes)
+                # Only this entry's violations count — earlier entries had none.
+                # A changed agent_id is reported by the scan below.
+                if (
+                    len(chain_violations) > violations_before
+                    or not sig_results[env.sequence][0]
+                    or env.agent_id != expected_agent
+                ):
+                    checked = i + 1
                     break
 
-        use_parallel = self._parallel and len(self.envelopes) >= _PARALLEL_THRESHOLD
-        sig_results = (
-            self._verify_signatures_parallel() if use_parallel else self._verify_signatures_sequential()
-        )
+        # Stopped early: the remaining entries still count towards the
+        # record-type and agent totals, which need no verification.
+        for env in self.envelopes[checked:]:
+            counts[env.record_type] += 1
+            agents.add(env.agent_id)
+
+        # Reorders are found at load time (envelopes are already sorted, so
+        # the loop above cannot see them); report those among the entries
+        # checked, ahead of everything else.
+        out_of_order = self._out_of_order
+        if out_of_order and checked < len(self.envelopes):
+            checked_ids = {env.record_id for env in self.envelopes[:checked]}
+            out_of_order = [o for o in out_of_order if o[2] in checked_ids]
+        chain_violations[:0] = [
+            ChainViolation(
+                at_sequence=actual_seq,
+                record_id=rec_id,
+                violation_type="sequence_order",
+                detail=f"File position {fp} has sequence {actual_seq} -- reorder detected.",
+            )
+            for fp, actual_seq, rec_id in out_of_order
+        ]
+
+        for env in self.envelopes[1:checked]:
+            if env.agent_id != expected_agent:
+                chain_violations.append(
+                    ChainViolation(
+                        at_sequence=env.sequence,
+                        record_id=env.record_id,
+                        violation_type="mixed_agent_id",
+                        detail=(
+                            f"agent_id changed from '{expected_agent}' "
+                            f"to '{env.agent_id}' at seq {env.sequence}."
+                        ),
+                    )
+                )
+                break
+
+        if not fail_fast:
+            use_parallel = self._parallel and len(self.envelopes) >= _PARALLEL_THRESHOLD
+            sig_results = (
+                self._verify_signatures_parallel(canonical)
+                if use_parallel
+                else self._verify_signatures_sequential(canonical)
+            )
 
         sig_violations: List[ChainViolation] = []
         valid_sigs = 0
         invalid_sigs = 0
-        for env in self.envelopes:
+        for env in self.envelopes[:checked]:
             ok, reason = sig_results.get(env.sequence, (False, "mismatch"))
             if ok:
                 valid_sigs += 1
@@ -642,9 +803,6 @@ class ReplayEngine:
                 )
 
         self.violations = chain_violations + sig_violations
-        counts: Dict[str, int] = defaultdict(int)
-        for env in self.envelopes:
-            counts[env.record_type] += 1
 
         return ReplaySummary(
             total_entries=len(self.envelopes),
@@ -653,10 +811,11 @@ class ReplayEngine:
             valid_signatures=valid_sigs,
             invalid_signatures=invalid_sigs,
             record_type_counts=dict(counts),
-            agents_seen=sorted({e.agent_id for e in self.envelopes}),
+            agents_seen=sorted(agents),
             gef_version=self.envelopes[0].gef_version,
             first_timestamp=self.envelopes[0].timestamp,
             last_timestamp=self.envelopes[-1].timestamp,
+            entries_checked=checked if checked < len(self.envelopes) else None,
         )
 
     def _empty_summary(self) -> ReplaySummary:
@@ -673,25 +832,43 @@ class ReplayEngine:
             last_timestamp=None,
         )
 
-    def _verify_signatures_sequential(self) -> Dict[int, Tuple[bool, str]]:
+    def _verify_signatures_sequential(
+        self, canonical: List[bytes]
+    ) -> Dict[int, Tuple[bool, str]]:
         results: Dict[int, Tuple[bool, str]] = {}
-        for env in self.envelopes:
-            ok, reason = env.verify_signature()
+        for env, data in zip(self.envelopes, canonical):
+            ok, reason = env.verify_signature(canonical_bytes=data)
             results[env.sequence] = (ok, reason)
         return results
 
-    def _verify_signatures_parallel(self) -> Dict[int, Tuple[bool, str]]:
+    def _verify_signatures_parallel(
+        self, canonical: List[bytes]
+    ) -> Dict[int, Tuple[bool, str]]:
         cpu_count = os.cpu_count() or 1
+        if cpu_count < 2:
+            # A single worker process only adds pickling and spawn cost.
+            return self._verify_signatures_sequential(canonical)
+        # Imported here: concurrent.futures.process drags in multiprocessing,
+        # which sequential verification and the CLI's startup never need.
+        from concurrent.futures import ProcessPoolExecutor
         batch_size = max(1, len(self.envelopes) // (cpu_count * _BATCH_SIZE_PER_WORKER_MULTIPLIER))
+        # Group by signer so each worker's parsed-key cache sees one key per
+        # run. Stable sort: a single-signer ledger (the norm) keeps its order
+        # and Timsort detects that in one linear pass. Workers get the
+        # canonical bytes verify() already built, not dicts to re-encode.
+        ordered = sorted(
+            zip(self.envelopes, canonical),
+            key=lambda pair: pair[0].signer_public_key,
+        )
         batches = [
             [
-                (e.to_signing_dict(), e.signature, e.signer_public_key, e.sequence)
-                for e in self.envelopes[i : i + batch_size]
+                (data, e.signature, e.signer_public_key, e.sequence)
+                for e, data in ordered[i : i + batch_size]
             ]
-            for i in range(0, len(self.envelopes), batch_size)
+            for i in range(0, len(ordered), batch_size)
         ]
         results: Dict[int, Tuple[bool, str]] = {}
-        with ProcessPoolExecutor(max_workers=cpu_count) as ex:
+        with ProcessPoolExecutor(max_workers=min(cpu_count, len(batches))) as ex:
             for batch_result in ex.map(_verify_sig_batch, batches):
                 for seq, ok, reason in batch_result:
                     results[seq] = (ok, reason)
@@ -703,8 +880,9 @@ class ReplayEngine:
             raise FileNotFoundError(f"GEF ledger not found: {ledger_path}")
 
         violations: List[ChainViolation] = []
-        seen_nonces: Set[str] = set()
+        seen_nonces: Set[Any] = set()
         prev: Optional[ExecutionEnvelope] = None
+        prev_bytes: Optional[bytes] = None
         gef_version: Optional[str] = None
         valid_sigs = 0
         invalid_sigs = 0
@@ -715,13 +893,13 @@ class ReplayEngine:
         last_ts: Optional[str] = None
         t_start = time.time()
 
-        with open(ledger_path, "r", encoding="utf-8") as f:
+        with _open_ledger(ledger_path) as f:
             for line_num, raw in enumerate(f, 1):
                 raw = raw.strip()
                 if not raw:
                     continue
                 try:
-                    data = json.loads(raw)
+                    data = json_loads(raw)
                 except json.JSONDecodeError:
                     violations.append(
                         ChainViolation(
@@ -767,7 +945,9 @@ class ReplayEngine:
                         )
                     )
 
-                if not env.verify_chain(prev):
+                canonical = env.canonical_bytes_for_signing()
+
+                if not env.verify_chain(prev, prev_bytes):
                     expected = compute_boundary_hash(prev)
                     violations.append(
                         ChainViolation(
@@ -781,7 +961,8 @@ class ReplayEngine:
                         )
                     )
 
-                if env.nonce in seen_nonces:
+                nonce_key = _nonce_key(env.nonce)
+                if nonce_key in seen_nonces:
                     violations.append(
                         ChainViolation(
                             at_sequence=env.sequence,
@@ -790,9 +971,9 @@ class ReplayEngine:
                             detail=f"Duplicate nonce '{env.nonce}' (INV-29)",
                         )
                     )
-                seen_nonces.add(env.nonce)
+                seen_nonces.add(nonce_key)
 
-                sig_ok, sig_reason = env.verify_signature()
+                sig_ok, sig_reason = env.verify_signature(canonical_bytes=canonical)
                 if sig_ok:
                     valid_sigs += 1
                 else:
@@ -816,6 +997,7 @@ class ReplayEngine:
                 last_ts = env.timestamp
                 total += 1
                 prev = env
+                prev_bytes = canonical
 
                 if not self._silent and total % _STREAM_PROGRESS_INTERVAL == 0:
                     elapsed = time.time() - t_start
@@ -852,8 +1034,9 @@ class ReplayEngine:
             print(f"  Checkpoint #{num_ckpts}: seq {ckpt.sequence:,}, offset {ckpt.file_offset:,} bytes")
 
         violations: List[ChainViolation] = []
-        seen_nonces: Set[str] = set()
+        seen_nonces: Set[Any] = set()
         prev: Optional[ExecutionEnvelope] = None
+        prev_bytes: Optional[bytes] = None
         gef_version: Optional[str] = None
         valid_sigs = 0
         invalid_sigs = 0
@@ -863,14 +1046,14 @@ class ReplayEngine:
         first_ts: Optional[str] = None
         last_ts: Optional[str] = None
 
-        with open(ledger_path, "r", encoding="utf-8") as f:
+        with _open_ledger(ledger_path) as f:
             f.seek(ckpt.file_offset)
             for raw in f:
                 raw = raw.strip()
                 if not raw:
                     continue
                 try:
-                    data = json.loads(raw)
+                    data = json_loads(raw)
                     env = ExecutionEnvelope.from_dict(data)
                 except Exception:
                     continue
@@ -878,7 +1061,9 @@ class ReplayEngine:
                 if gef_version is None:
                     gef_version = env.gef_version
 
-                if not env.verify_chain(prev):
+                canonical = env.canonical_bytes_for_signing()
+
+                if not env.verify_chain(prev, prev_bytes):
                     expected = compute_boundary_hash(prev)
                     violations.append(
                         ChainViolation(
@@ -892,7 +1077,8 @@ class ReplayEngine:
                         )
                     )
 
-                if env.nonce in seen_nonces:
+                nonce_key = _nonce_key(env.nonce)
+                if nonce_key in seen_nonces:
                     violations.append(
                         ChainViolation(
                             at_sequence=env.sequence,
@@ -901,9 +1087,9 @@ class ReplayEngine:
                             detail=f"Duplicate nonce '{env.nonce}' (INV-29)",
                         )
                     )
-                seen_nonces.add(env.nonce)
+                seen_nonces.add(nonce_key)
 
-                sig_ok, sig_reason = env.verify_signature()
+                sig_ok, sig_reason = env.verify_signature(canonical_bytes=canonical)
                 if sig_ok:
                     valid_sigs += 1
                 else:
@@ -924,6 +1110,7 @@ class ReplayEngine:
                 last_ts = env.timestamp
                 total += 1
                 prev = env
+                prev_bytes = canonical
 
         return ReplaySummary(
             total_entries=ckpt.sequence + total,
@@ -944,47 +1131,77 @@ class ReplayEngine:
             return
         summary = self.verify()
         bar = "=" * 80
-        print(f"\n{bar}\nGuardClaw GEF Replay Timeline\n{bar}")
-        print(f"  Ledger      : {self._ledger_path or 'in-memory'}")
-        print(f"  GEF Version : {summary.gef_version}")
-        print(f"  Entries     : {summary.total_entries:,}")
-        print(f"  Chain       : {'VALID' if summary.chain_valid else 'VIOLATED'}")
-        print(f"  Valid sigs  : {summary.valid_signatures:,}")
-        print(f"  Invalid sigs: {summary.invalid_signatures:,}")
-        print(f"  Agents      : {', '.join(summary.agents_seen)}")
-        print(f"  First entry : {summary.first_timestamp}")
-        print(f"  Last entry  : {summary.last_timestamp}\n")
-        to_show = self.envelopes[:max_entries] if max_entries else self.envelopes
+        # Output is collected and written every _TIMELINE_FLUSH_EVERY entries
+        # rather than one print() (stdout lock + encode) per line.
+        write = sys.stdout.write
+        buf: List[str] = []
+        out = buf.append
+        out(f"\n{bar}\nGuardClaw GEF Replay Timeline\n{bar}\n")
+        out(f"  Ledger      : {self._ledger_path or 'in-memory'}\n")
+        out(f"  GEF Version : {summary.gef_version}\n")
+        out(f"  Entries     : {summary.total_entries:,}\n")
+        out(f"  Chain       : {'VALID' if summary.chain_valid else 'VIOLATED'}\n")
+        out(f"  Valid sigs  : {summary.valid_signatures:,}\n")
+        out(f"  Invalid sigs: {summary.invalid_signatures:,}\n")
+        out(f"  Agents      : {', '.join(summary.agents_seen)}\n")
+        out(f"  First entry : {summary.first_timestamp}\n")
+        out(f"  Last entry  : {summary.last_timestamp}\n\n")
+        envelopes = self.envelopes
+        status = _TIMELINE_STATUS
+        to_show = envelopes[:max_entries] if max_entries else envelopes
+        # Each row's canonical bytes check its signature and, when the next
+        # row's predecessor is this envelope (the in-order case), that
+        # row's causal hash too — one JCS pass per row instead of two.
+        last_env: Optional[ExecutionEnvelope] = None
+        last_bytes: Optional[bytes] = None
         for env in to_show:
-            prev = self.envelopes[env.sequence - 1] if env.sequence > 0 else None
-            sig_ok, _ = env.verify_signature()
-            print(f"  [{env.sequence:04d}] {env.timestamp}  {env.record_type}")
-            print(f"         record_id   : {env.record_id}")
-            print(f"         causal_hash : ...{env.causal_hash[-12:]}")
-            print(f"         sig:{'OK' if sig_ok else 'FAIL'}  chain:{'OK' if env.verify_chain(prev) else 'FAIL'}\n")
+            prev = envelopes[env.sequence - 1] if env.sequence > 0 else None
+            env_bytes = env.canonical_bytes_for_signing()
+            sig_ok, _ = env.verify_signature(canonical_bytes=env_bytes)
+            chain_ok = env.verify_chain(prev, last_bytes if prev is last_env else None)
+            last_env, last_bytes = env, env_bytes
+            out(
+                f"  [{env.sequence:04d}] {env.timestamp}  {env.record_type}\n"
+                f"         record_id   : {env.record_id}\n"
+                f"         causal_hash : ...{env.causal_hash[-12:]}\n"
+                f"         sig:{status[sig_ok]}  chain:{status[chain_ok]}\n\n"
+            )
+            if len(buf) >= _TIMELINE_FLUSH_EVERY:
+                write("".join(buf))
+                buf.clear()
         if max_entries and len(self.envelopes) > max_entries:
-            print(f"  ... and {len(self.envelopes) - max_entries:,} more not shown\n")
-        print("-" * 80)
+            out(f"  ... and {len(self.envelopes) - max_entries:,} more not shown\n\n")
+        out("-" * 80 + "\n")
         if summary.violations:
-            print(f"{len(summary.violations)} VIOLATION(S):")
+            out(f"{len(summary.violations)} VIOLATION(S):\n")
             for v in summary.violations:
-                print(f"  [seq {v.at_sequence:04d}] {v.violation_type.upper():30s} | {v.detail}")
+                out(f"  [seq {v.at_sequence:04d}] {v.violation_type.upper():30s} | {v.detail}\n")
         else:
-            print("All entries verified -- chain intact, all signatures valid.")
-        print("-" * 80 + "\n")
-
-    def export_json(self, output_path: Path) -> None:
+            out("All entries verified -- chain intact, all signatures valid.\n")
+        out("-" * 80 + "\n\n")
+        write("".join(buf))
+
+    def export_json(
+        self, output_path: Path, summary: Optional[ReplaySummary] = None
+    ) -> None:
+        """
+        Write the replay report as JSON. Pass the summary from a verify()
+        that has already run to skip verifying the ledger a second time.
+        entries_checked is carried into the report, so one from
+        verify(fail_fast=True) that stopped early is marked as partial.
+        """
         if not self.envelopes:
             raise RuntimeError("No envelopes loaded. Call load() first.")
-        summary = self.verify()
+        if summary is None:
+            summary = self.verify()
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        import json as _json
         report = {
             "gef_replay_report": {
                 "version": "1.0",
                 "ledger": str(self._ledger_path or "in-memory"),
                 "total_entries": summary.total_entries,
+                "entries_checked": summary.entries_checked,
                 "chain_valid": summary.chain_valid,
                 "valid_signatures": summary.valid_signatures,
                 "invalid_signatures": summary.invalid_signatures,
@@ -1005,6 +1222,6 @@ class ReplayEngine:
             }
         }
         with open(output_path, "w", encoding="utf-8") as f:
-            _json.dump(report, f, indent=2)
+            f.write(json_dumps_indent(report))
         if not self._silent:
             print(f"Report written to: {output_path}")
@@ -38,7 +38,9 @@ def build_summary_from_engine(
     entries: List[Dict[str, Any]] = [
         {
             "sequence": env.sequence,
-            "record_type": env.record_type.value if hasattr(env.record_type, "value") else env.record_type,
+            # record_type is always a plain str (RecordType holds str
+            # constants and from_dict() reads it straight from JSON).
+            "record_type": env.record_type,
             "timestamp": env.timestamp,
             "record_id": env.record_id,
             "causal_hash": env.causal_hash,
@@ -1,15 +1,18 @@
 """
 guardclaw/core/time.py
 
-THE ONLY TIMESTAMP FUNCTION IN GUARDCLAW.
+THE ONLY TIMESTAMP FUNCTIONS IN GUARDCLAW.
 
 GEF Wire Format: YYYY-MM-DDTHH:MM:SS.mmmZ
                  (milliseconds, explicit Z, no +00:00, no microseconds)
 
-Every module that needs a timestamp imports gef_timestamp() from here.
-Nothing else. No datetime.now().isoformat(). No utc_now(). Only this.
+Every module that needs a timestamp imports it from here. GEF records
+use gef_timestamp(). The Phase 5 adapters' observer events use
+utc_isoformat_now() (fixed-width ISO-8601). Nothing else. No
+datetime.now().isoformat(). No utc_now().
 """
 
+import time
 from datetime import datetime, timezone
 
 
@@ -21,3 +24,27 @@ def gef_timestamp() -> str:
     now = datetime.now(timezone.utc)
     ms  = now.microsecond // 1000
     return now.strftime("%Y-%m-%dT%H:%M:%S.") + f"{ms:03d}Z"
+
+
+# (epoch_minute, "YYYY-MM-DDTHH:MM:") — prefix is rebuilt only when the minute rolls.
+_utc_minute_cache = (-1, "")
+
+
+def utc_isoformat_now() -> str:
+    """
+    Current UTC time as ISO-8601 with microseconds and +00:00 offset.
+
+    Always fixed width: YYYY-MM-DDTHH:MM:SS.ffffff+00:00. Unlike
+    datetime.now(timezone.utc).isoformat(), the fraction is kept when the
+    microsecond is 0 (".000000"). Built from time.time_ns() without
+    constructing a datetime on every call.
+    """
+    global _utc_minute_cache
+    usec = time.time_ns() // 1000
+    minute, usec_in_minute = divmod(usec, 60_000_000)
+    cached_minute, prefix = _utc_minute_cache
+    if minute != cached_minute:
+        prefix = datetime.fromtimestamp(minute * 60, timezone.utc).strftime("%Y-%m-%dT%H:%M:")
+        _utc_minute_cache = (minute, prefix)
+    ss, us = divmod(usec_in_minute, 1_000_000)
+    return f"{prefix}{ss:02d}.{us:06d}+00:00"
@@ -14,11 +14,12 @@ Protocol Law:
 """
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from guardclaw.core.jsonio import json_loads
 from guardclaw.core.models import ExecutionEnvelope, GENESIS_HASH
+from guardclaw.core.time import gef_timestamp
 
 
 # ─────────────────────────────────────────────────────────────
@@ -36,9 +37,7 @@ class VerificationResult:
     def __post_init__(self):
         if self.details is None:
             self.details = {}
-        self.verified_at = datetime.now(timezone.utc).strftime(
-            "%Y-%m-%dT%H:%M:%S."
-        ) + f"{datetime.now(timezone.utc).microsecond // 1000:03d}Z"
+        self.verified_at = gef_timestamp()
 
     def __repr__(self) -> str:
         status = "VALID" if self.valid else "INVALID"
@@ -188,7 +187,6 @@ def verify_ledger_file(
     Returns:
         (all_valid: bool, results: List[VerificationResult])
     """
-    import json
     results: List[VerificationResult] = []
     envelopes: List[ExecutionEnvelope] = []
 
@@ -198,7 +196,7 @@ def verify_ledger_file(
             if not raw:
                 continue
             try:
-                data = json.loads(raw)
+                data = json_loads(raw)
                 env  = ExecutionEnvelope.from_dict(data)
                 envelopes.append(env)
             except Exception as e:
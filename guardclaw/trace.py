@@ -29,14 +29,12 @@ import json
 from pathlib import Path
 from typing import Any, Callable
 
-from guardclaw.core.emitter import (
-    get_global_ledger,
-    has_global_ledger,
-    init_global_ledger,
-)
-from guardclaw.core.models import RecordType
 from guardclaw.core.time import gef_timestamp
 
+# The ledger stack (emitter → ledger → crypto → cryptography/PyNaCl) is
+# imported inside the functions below, not here: `import guardclaw` loads
+# this module eagerly and must stay light.
+
 
 # ── Module-level state ────────────────────────────────────────
 
@@ -83,6 +81,11 @@ def _get_or_init_ledger(agent_id: str):
     Return the active global ledger, or auto-initialize one.
     Never overrides an existing ledger.
     """
+    from guardclaw.core.emitter import (
+        get_global_ledger,
+        has_global_ledger,
+        init_global_ledger,
+    )
     if has_global_ledger():
         return get_global_ledger(), False  # (ledger, did_init)
 
@@ -110,6 +113,8 @@ def trace(agent_id: str) -> Callable:
         def search(query: str) -> dict:
             return api.search(query)
     """
+    from guardclaw.core.models import RecordType
+
     def decorator(fn: Callable) -> Callable:
         @functools.wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
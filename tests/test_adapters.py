@@ -0,0 +1,335 @@
+"""
+tests/test_adapters.py
+
+Adapter tests: GenericAgentObserver and ToolObserver against a recording
+observer backend.
+
+Run:
+    pytest tests/test_adapters.py -v --tb=short
+"""
+
+import hashlib
+import threading
+import warnings
+from types import SimpleNamespace
+
+import pytest
+
+from guardclaw.adapters.generic_agent import GenericAgentObserver
+from guardclaw.adapters.tool_wrapper import ToolObserver
+
+
+class _RecordingObserver:
+    """Stands in for the observer backend; records every call in order."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _record(self, kind, kwargs):
+        with self._lock:
+            self.calls.append((kind, kwargs))
+            return SimpleNamespace(event_id=f"evt-{len(self.calls)}")
+
+    def observe_execution(self, **kwargs):
+        return self._record("execution", kwargs)
+
+    def observe_result(self, **kwargs):
+        return self._record("result", kwargs)
+
+    def observe_failure(self, **kwargs):
+        return self._record("failure", kwargs)
+
+    def stop(self, reason=""):
+        pass
+
+
+# ─────────────────────────────────────────────────────────────
+# GenericAgentObserver
+# ─────────────────────────────────────────────────────────────
+
+def test_observe_result_cyclic_result_falls_back_to_str_digest():
+    rec = _RecordingObserver()
+    agent = GenericAgentObserver("agent-001", observer=rec)
+
+    loop = []
+    loop.append(loop)
+    agent.observe_result(loop)
+
+    expected = hashlib.blake2b(str(loop).encode("utf-8"), digest_size=32).hexdigest()
+    assert [kind for kind, _ in rec.calls] == ["result"]
+    assert rec.calls[0][1]["result_hash"] == expected
+
+
+@pytest.mark.parametrize("result", [{1: "ok"}, {(0, 1): "x"}])
+def test_observe_result_non_str_keys_fall_back_to_str_digest(result):
+    rec = _RecordingObserver()
+    agent = GenericAgentObserver("agent-001", observer=rec)
+
+    agent.observe_result(result)
+
+    expected = hashlib.blake2b(str(result).encode("utf-8"), digest_size=32).hexdigest()
+    assert rec.calls[0][1]["result_hash"] == expected
+
+
+def test_observe_result_non_contiguous_memoryview_is_hashed_as_bytes():
+    rec = _RecordingObserver()
+    agent = GenericAgentObserver("agent-001", observer=rec)
+
+    view = memoryview(b"abcdef")[::2]
+    agent.observe_result(view)
+
+    expected = hashlib.blake2b(b"ace", digest_size=32).hexdigest()
+    assert rec.calls[0][1]["result_hash"] == expected
+
+
+def test_observe_result_released_memoryview_falls_back_to_str_digest():
+    rec = _RecordingObserver()
+    agent = GenericAgentObserver("agent-001", observer=rec)
+
+    view = memoryview(b"abc")
+    view.release()
+    agent.observe_result(view)
+
+    expected = hashlib.blake2b(str(view).encode("utf-8"), digest_size=32).hexdigest()
+    assert rec.calls[0][1]["result_hash"] == expected
+
+
+@pytest.mark.parametrize("context", [{1: "ok"}, {"x": float("nan")}])
+def test_observe_action_unencodable_context_falls_back_to_str_digest(context):
+    rec = _RecordingObserver()
+    agent = GenericAgentObserver("agent-001", observer=rec)
+
+    agent.observe_action("run", context=context)
+
+    expected = hashlib.blake2b(str(context).encode("utf-8"), digest_size=32).hexdigest()
+    assert [kind for kind, _ in rec.calls] == ["execution"]
+    assert rec.calls[0][1]["context_hash"] == expected
+
+
+def test_str_enum_agent_id_and_action_are_accepted():
+    from enum import Enum
+
+    class Name(str, Enum):
+        AGENT = "agent-001"
+        RUN = "run"
+
+    rec = _RecordingObserver()
+    agent = GenericAgentObserver(Name.AGENT, observer=rec)
+    agent.observe_action(Name.RUN)
+
+    assert rec.calls[0][1]["subject_id"] is Name.AGENT
+    assert rec.calls[0][1]["action"] is Name.RUN
+
+
+def test_generic_agent_observer_is_weak_referenceable():
+    import weakref
+    agent = GenericAgentObserver("agent-001", observer=_RecordingObserver())
+    assert weakref.ref(agent)() is agent
+
+
+def test_sha256_context_and_result_hashes_match_legacy_framing():
+    import json
+    rec = _RecordingObserver()
+    agent = GenericAgentObserver("agent-001", observer=rec, hash_algorithm="sha256")
+
+    context = {"b": 2, "a": "é"}
+    agent.observe_action("run", context=context)
+    agent.observe_result(b"raw")
+
+    legacy_context = json.dumps(context, sort_keys=True)
+    assert rec.calls[0][1]["context_hash"] == hashlib.sha256(legacy_context.encode()).hexdigest()
+    assert rec.calls[1][1]["result_hash"] == hashlib.sha256(str(b"raw").encode()).hexdigest()
+
+
+def test_generic_agent_invalid_hash_algorithm_rejected():
+    with pytest.raises(ValueError):
+        GenericAgentObserver("agent-001", observer=_RecordingObserver(), hash_algorithm="md5")
+
+
+# ─────────────────────────────────────────────────────────────
+# ToolObserver
+# ─────────────────────────────────────────────────────────────
+
+def test_sha256_inputs_hash_matches_legacy_json_framing():
+    import json
+    tool = ToolObserver("t", "agent-001", observer=_RecordingObserver(), hash_algorithm="sha256")
+    legacy = json.dumps({"args": ["1", "x"], "kwargs": {"b": "2", "a": "é"}}, sort_keys=True)
+    assert tool._hash_inputs((1, "x"), {"b": 2, "a": "é"}) == hashlib.sha256(legacy.encode()).hexdigest()
+
+
+def test_tool_observer_is_weak_referenceable():
+    import weakref
+    tool = ToolObserver("t", "agent-001", observer=_RecordingObserver())
+    assert weakref.ref(tool)() is tool
+
+
+def test_background_queues_execution_before_tool_runs():
+    rec = _RecordingObserver()
+    tool = ToolObserver("t", "agent-001", observer=rec, background=True)
+    seen_during_call = threading.Event()
+
+    def fn(x):
+        # The worker can only emit EXECUTION here if it was queued first.
+        for _ in range(200):
+            if rec.calls:
+                seen_during_call.set()
+                break
+            threading.Event().wait(0.01)
+        return x * 2
+
+    assert tool.wrap(fn)(21) == 42
+    tool.stop()
+
+    assert seen_during_call.is_set()
+    assert [kind for kind, _ in rec.calls] == ["execution", "result"]
+    assert rec.calls[1][1]["correlation_id"] == "evt-1"
+    assert rec.calls[0][1]["execution_timestamp"] == rec.calls[1][1]["execution_timestamp"]
+
+
+def test_background_stop_flushes_every_observation():
+    rec = _RecordingObserver()
+    tool = ToolObserver("t", "agent-001", observer=rec, background=True)
+    wrapped = tool.wrap(lambda x: x)
+
+    for i in range(500):
+        wrapped(i)
+    tool.stop()
+
+    kinds = [kind for kind, _ in rec.calls]
+    assert kinds == ["execution", "result"] * 500
+    # After stop() there is no worker; later calls observe synchronously.
+    wrapped(0)
+    assert len(rec.calls) == 1002
+
+
+def test_unreferenced_background_observer_is_collected_and_its_worker_ends():
+    import gc
+    import weakref
+    from guardclaw.adapters import tool_wrapper
+
+    rec = _RecordingObserver()
+    tool = ToolObserver("t", "agent-001", observer=rec, background=True)
+    tool.wrap(lambda x: x)(1)
+    worker, ref = tool._worker, weakref.ref(tool)
+    del tool
+    gc.collect()
+
+    assert ref() is None
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert [kind for kind, _ in rec.calls] == ["execution", "result"]
+    assert not any(o is None for o in tool_wrapper._BACKGROUND_OBSERVERS)
+
+
+def test_background_stop_does_not_hang_when_a_callback_reenters_the_tool():
+    holder = {}
+
+    class ReentrantObserver(_RecordingObserver):
+        def observe_result(self, **kwargs):
+            event = super().observe_result(**kwargs)
+            if len(self.calls) == 2:
+                # Re-enter only once stop() holds the lock and is joining
+                for _ in range(500):
+                    if holder["tool"]._lock.locked():
+                        break
+                    threading.Event().wait(0.01)
+                holder["wrapped"](2)  # runs on the worker thread
+            return event
+
+    rec = ReentrantObserver()
+    tool = holder["tool"] = ToolObserver("t", "agent-001", observer=rec, background=True)
+    holder["wrapped"] = tool.wrap(lambda x: x)
+    holder["wrapped"](1)
+
+    stopper = threading.Thread(target=tool.stop, daemon=True)
+    stopper.start()
+    stopper.join(timeout=5)
+
+    assert not stopper.is_alive()
+    assert [kind for kind, _ in rec.calls] == ["execution", "result"] * 2
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_tool_exception_propagates_and_is_observed(background):
+    rec = _RecordingObserver()
+    tool = ToolObserver("t", "agent-001", observer=rec, background=background)
+
+    def boom():
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        tool.wrap(boom)()
+    tool.stop()
+
+    assert [kind for kind, _ in rec.calls] == ["execution", "failure"]
+    failure = rec.calls[1][1]
+    assert failure["correlation_id"] == "evt-1"
+    assert failure["metadata"] == {"error_type": "KeyError"}
+
+
+@pytest.mark.parametrize("rate,expected", [(0.0, 0), (1.0, 100)])
+def test_sample_rate_bounds(rate, expected):
+    rec = _RecordingObserver()
+    wrapped = ToolObserver("t", "agent-001", observer=rec, sample_rate=rate).wrap(lambda: None)
+    for _ in range(50):
+        wrapped()
+    assert len(rec.calls) == expected
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"sample_rate": -0.1},
+    {"sample_rate": 1.5},
+    {"hash_algorithm": "md5"},
+])
+def test_invalid_arguments_rejected(kwargs):
+    with pytest.raises(ValueError):
+        ToolObserver("t", "agent-001", observer=_RecordingObserver(), **kwargs)
+
+
+def test_observer_failure_warns_once_and_tool_keeps_running():
+    class _Broken(_RecordingObserver):
+        def observe_execution(self, **kwargs):
+            raise OSError("disk full")
+
+    wrapped = ToolObserver("t", "agent-001", observer=_Broken()).wrap(lambda x: x + 1)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert [wrapped(i) for i in range(3)] == [1, 2, 3]
+
+    assert len(caught) == 1
+    assert issubclass(caught[0].category, RuntimeWarning)
+    assert "disk full" in str(caught[0].message)
+
+
+def test_observe_tool_background_flushes_at_interpreter_exit(tmp_path):
+    import subprocess
+    import sys
+    out = tmp_path / "observations.txt"
+    code = f"""
+from types import SimpleNamespace
+from guardclaw.adapters.tool_wrapper import observe_tool
+
+class FileObserver:
+    def _record(self, kind):
+        with open({str(out)!r}, "a") as f:
+            f.write(kind + "\\n")
+        return SimpleNamespace(event_id="evt")
+    def observe_execution(self, **kwargs):
+        return self._record("execution")
+    def observe_result(self, **kwargs):
+        return self._record("result")
+    def stop(self, reason=""):
+        pass
+
+@observe_tool("t", "agent-001", observer=FileObserver(), background=True)
+def double(x):
+    return x * 2
+
+for i in range(50):
+    double(i)
+assert double.tool_observer is not None
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+    assert out.read_text().split() == ["execution", "result"] * 50
@@ -350,6 +350,35 @@ class TestKeyConfusionAttacks:
         canonical_bytes = canonical_json_encode(_signing_surface(entry))
         assert key1.verify_detached(canonical_bytes, sig, key1.public_key_hex)
 
+    def test_signature_identical_across_backends(self):
+        # Ed25519 is deterministic: libsodium and cryptography must agree byte-for-byte
+        import base64
+        key = Ed25519KeyManager.from_private_bytes(bytes(range(32)))
+        data = canonical_json_encode({"x": 1})
+        raw = key._private_key.sign(data)
+        assert key.sign(data) == base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @pytest.mark.parametrize("use_nacl", [False, True])
+    @pytest.mark.parametrize("pub_hex", [
+        "01" + "00" * 31,                        # identity point
+        "ee" + "ff" * 30 + "7f",                 # identity, non-canonical (y = p + 1)
+    ])
+    def test_small_order_forgery_rejected_on_both_backends(self, monkeypatch, pub_hex, use_nacl):
+        # R = identity, S = 0 "verifies" any message under the identity key
+        # with OpenSSL; libsodium refuses it. The verdict must not depend on
+        # which backend is installed.
+        import base64
+        from guardclaw.core import crypto
+        if use_nacl and not crypto._HAVE_NACL:
+            pytest.skip("PyNaCl not installed")
+        monkeypatch.setattr(crypto, "_HAVE_NACL", use_nacl)
+        crypto._verify_key_from_hex.cache_clear()
+        try:
+            forged = base64.urlsafe_b64encode(b"\x01" + bytes(63)).rstrip(b"=").decode("ascii")
+            assert not Ed25519KeyManager.verify_detached(b"any message", forged, pub_hex)
+        finally:
+            crypto._verify_key_from_hex.cache_clear()
+
     def test_key_rollover_forgery_detected(self, tmp_path):
         key1 = Ed25519KeyManager.generate(); key2 = Ed25519KeyManager.generate()
         ledger = GEFLedger(key_manager=key1, agent_id="agent1", ledger_path=str(tmp_path))
@@ -403,6 +432,18 @@ class TestReplayAttacks:
             assert nonce == nonce.lower()
             assert all(c in "0123456789abcdef" for c in nonce)
 
+    def test_int_nonce_does_not_collide_with_equal_hex_nonce(self, tmp_path):
+        # Streaming verification skips validate_schema(), so an int nonce
+        # reaches the seen-set; 255 must not be taken for a replay of "000...0ff".
+        _, _, path = _make_ledger(str(tmp_path), n=2)
+        lines = _load_lines(path)
+        e0, e1 = json.loads(lines[0]), json.loads(lines[1])
+        e0["nonce"] = 255
+        e1["nonce"] = "0" * 30 + "ff"
+        _save_lines(path, [json.dumps(e0) + "\n", json.dumps(e1) + "\n"])
+        s = ReplayEngine(parallel=False, silent=True).stream_verify_legacy(path)
+        assert not any("Duplicate nonce" in v.detail for v in s.violations)
+
     def test_cross_agent_same_nonce_not_replay(self, tmp_path):
         tmp1 = str(tmp_path / "a1"); tmp2 = str(tmp_path / "a2")
         os.makedirs(tmp1); os.makedirs(tmp2)
@@ -449,6 +490,32 @@ class TestSchemaAndCanonical:
         b_float = canonical_json_encode({"v": 1.0})
         assert isinstance(b_int, bytes) and isinstance(b_float, bytes)
 
+    def test_canonical_fast_path_matches_reference_jcs(self):
+        import jcs
+        cases = [
+            {"b": [1, {"z": None, "y": True}], "a": "ctl\x01\x7f "},
+            {"big": 2 ** 53 + 1, "neg": -(2 ** 60), "f": 0.1, "e": 1e21},
+            {"é": 1, "\U0001f510": 2, "￿": 3, "z": "नमस्ते"},
+            {"t": (1, 2), "empty": {}, "list": []},
+        ]
+        for obj in cases:
+            assert canonical_json_encode(obj) == jcs.canonicalize(obj)
+
+    def test_canonical_cyclic_input_raises(self):
+        loop = []
+        loop.append(loop)
+        node = {"k": "v"}
+        node["self"] = node
+        for obj in (loop, node):
+            with pytest.raises(ValueError, match="Circular reference"):
+                canonical_json_encode(obj)
+
+    def test_canonical_shared_subobject_matches_reference_jcs(self):
+        import jcs
+        shared = {"x": [1, 2]}
+        obj = {"a": shared, "b": shared}
+        assert canonical_json_encode(obj) == jcs.canonicalize(obj)
+
     def test_canonical_null_value_in_payload(self, tmp_path):
         key = Ed25519KeyManager.generate()
         ledger = GEFLedger(key_manager=key, agent_id="null-test", ledger_path=str(tmp_path))
@@ -456,6 +523,14 @@ class TestSchemaAndCanonical:
         s = _verify(os.path.join(str(tmp_path), "ledger.jsonl"))
         assert s.chain_valid
 
+    def test_big_int_payload_survives_replay_parse(self, tmp_path):
+        key = Ed25519KeyManager.generate()
+        ledger = GEFLedger(key_manager=key, agent_id="bigint-test", ledger_path=str(tmp_path))
+        ledger.emit(record_type=RecordType.INTENT, payload={"n": 2 ** 70, "m": -(10 ** 19)})
+        s = _verify(os.path.join(str(tmp_path), "ledger.jsonl"))
+        assert s.chain_valid
+        assert s.invalid_signatures == 0
+
     def test_canonical_unicode_in_payload(self, tmp_path):
         key = Ed25519KeyManager.generate()
         ledger = GEFLedger(key_manager=key, agent_id="unicode-test", ledger_path=str(tmp_path))
@@ -497,11 +572,76 @@ class TestSchemaAndCanonical:
 
 class TestEdgeCases:
 
+    def test_trace_submodule_import_keeps_decorator_export(self):
+        # Fresh interpreter: the submodule must be imported before the name
+        # is ever read from the package for the shadowing to show.
+        import subprocess
+        import sys
+        code = (
+            "import guardclaw.trace, guardclaw\n"
+            "from guardclaw import trace\n"
+            "assert callable(guardclaw.trace) and guardclaw.trace is trace\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_import_guardclaw_does_not_load_crypto_backends(self):
+        # Public names are lazy; a bare import must not pull in the ledger
+        # stack (cryptography / PyNaCl) through the eager trace export.
+        import subprocess
+        import sys
+        code = (
+            "import sys, guardclaw\n"
+            "from guardclaw import canonical_json_encode, trace\n"
+            "loaded = {m.split('.')[0] for m in sys.modules}\n"
+            "assert not loaded & {'cryptography', 'nacl'}, loaded & {'cryptography', 'nacl'}\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_single_entry_verifies_clean(self, tmp_path):
         _, _, path = _make_ledger(str(tmp_path), n=1)
         s = _verify(path)
         assert s.chain_valid and s.total_entries == 1
 
+    def test_envelopes_are_weak_referenceable(self, tmp_path):
+        import weakref
+        _, ledger, _ = _make_ledger(str(tmp_path), n=1)
+        env = ledger.entries[0]
+        assert weakref.ref(env)() is env
+
+    def test_utf8_bom_line_is_rejected(self, tmp_path):
+        _, _, path = _make_ledger(str(tmp_path), n=2)
+        with open(path, "rb") as f:
+            data = f.read()
+        with open(path, "wb") as f:
+            f.write(b"\xef\xbb\xbf" + data)
+        engine = ReplayEngine(parallel=False, silent=True)
+        with pytest.raises(ValueError, match="Malformed JSON at line 1"):
+            engine.load(path)
+
+    def test_lines_end_at_newline_and_strip_ascii_whitespace_only(self, tmp_path):
+        _, _, path = _make_ledger(str(tmp_path), n=2)
+        with open(path, "rb") as f:
+            data = f.read()
+        engine = ReplayEngine(parallel=False, silent=True)
+
+        # CRLF and surrounding ASCII whitespace are fine
+        with open(path, "wb") as f:
+            f.write(b"  " + data.replace(b"\n", b" \r\n"))
+        engine.load(path)
+        assert engine.verify().chain_valid
+
+        # A lone "\r" does not end a line
+        with open(path, "wb") as f:
+            f.write(data.replace(b"\n", b"\r"))
+        with pytest.raises(ValueError, match="Malformed JSON at line 1"):
+            engine.load(path)
+
+        # Unicode whitespace (NBSP) is not stripped
+        with open(path, "wb") as f:
+            f.write(data.replace(b"\n", "\u00a0\n".encode("utf-8"), 1))
+        with pytest.raises(ValueError, match="Malformed JSON at line 1"):
+            engine.load(path)
+
     def test_empty_ledger_loads_cleanly(self, tmp_path):
         path = str(tmp_path / "empty.jsonl")
         open(path, "w").close()
@@ -553,6 +693,112 @@ class TestEdgeCases:
         s = _verify(path)
         assert not s.chain_valid or s.invalid_signatures >= 1
 
+    def test_fail_fast_stops_at_first_tampered_entry(self, tmp_path):
+        _, _, path = _make_ledger(str(tmp_path), n=20)
+        lines = _load_lines(path); entry = json.loads(lines[7])
+        entry["payload"]["data"] = "ATTACKER_MODIFIED"
+        lines[7] = json.dumps(entry) + "\n"
+        _save_lines(path, lines)
+        engine = ReplayEngine(parallel=False, silent=True)
+        engine.load(path)
+        s = engine.verify(fail_fast=True)
+        assert s.entries_checked == 8
+        assert s.valid_signatures == 7 and s.invalid_signatures == 1
+        assert [v.at_sequence for v in s.violations] == [7]
+        # Counts, agents and timestamps need no crypto: they cover all 20
+        assert sum(s.record_type_counts.values()) == 20
+        assert s.agents_seen == ["adv-agent"]
+        assert s.last_timestamp == engine.envelopes[-1].timestamp
+        assert engine.verify().entries_checked is None
+
+    def test_fail_fast_with_late_reorder_still_checks_earlier_entries(self, tmp_path):
+        _, _, path = _make_ledger(str(tmp_path), n=20)
+        lines = _load_lines(path)
+        lines[15], lines[16] = lines[16], lines[15]
+        _save_lines(path, lines)
+        engine = ReplayEngine(parallel=False, silent=True)
+        engine.load(path)
+        s = engine.verify(fail_fast=True)
+        # The reorder is reported, but does not stop verification at entry 0
+        assert s.valid_signatures == 20 and s.invalid_signatures == 0
+        assert {v.violation_type for v in s.violations} == {"sequence_order"}
+        assert [v.at_sequence for v in s.violations] == [16, 15]
+
+        # Stopping earlier (tamper at 7) leaves the later reorder out of scope
+        entry = json.loads(lines[7])
+        entry["payload"]["data"] = "ATTACKER_MODIFIED"
+        lines[7] = json.dumps(entry) + "\n"
+        _save_lines(path, lines)
+        engine.load(path)
+        s = engine.verify(fail_fast=True)
+        assert s.entries_checked == 8
+        assert [v.at_sequence for v in s.violations] == [7]
+
+    def test_fail_fast_cli_report_is_scoped_to_checked_entries(self, tmp_path):
+        from click.testing import CliRunner
+        from guardclaw.cli import cli
+        _, _, path = _make_ledger(str(tmp_path), n=20)
+        lines = _load_lines(path); entry = json.loads(lines[7])
+        entry["payload"]["data"] = "ATTACKER_MODIFIED"
+        lines[7] = json.dumps(entry) + "\n"
+        _save_lines(path, lines)
+        out = CliRunner().invoke(cli, ["verify", path, "--fail-fast", "--no-color"]).output
+        assert "after 8 of 20 entries (--fail-fast)" in out
+        assert "(entries 0 → 7 only)" in out and "0 → 7  (no gaps; rest not checked)" in out
+        assert "all causal hashes valid" not in out and "0 → 19" not in out
+        result = CliRunner().invoke(cli, ["verify", path, "--fail-fast", "--format", "json"])
+        assert result.exit_code == 1
+        assert json.loads(result.output)["guardclaw_verify"]["entries_checked"] == 8
+
+    def test_fail_fast_export_report_is_marked_partial(self, tmp_path):
+        from click.testing import CliRunner
+        from guardclaw.cli import cli
+        _, _, path = _make_ledger(str(tmp_path), n=20)
+        lines = _load_lines(path); entry = json.loads(lines[7])
+        entry["payload"]["data"] = "ATTACKER_MODIFIED"
+        lines[7] = json.dumps(entry) + "\n"
+        _save_lines(path, lines)
+        export = str(tmp_path / "report.json")
+        CliRunner().invoke(cli, ["verify", path, "--fail-fast", "--export", export, "--quiet"])
+        with open(export, encoding="utf-8") as f:
+            report = json.load(f)["gef_replay_report"]
+        assert report["total_entries"] == 20 and report["entries_checked"] == 8
+        assert report["valid_signatures"] + report["invalid_signatures"] == 8
+
+        CliRunner().invoke(cli, ["verify", path, "--export", export, "--quiet"])
+        with open(export, encoding="utf-8") as f:
+            assert json.load(f)["gef_replay_report"]["entries_checked"] is None
+
+    def test_filtered_load_keeps_matches_but_counts_whole_file(self, tmp_path):
+        _, _, path = _make_ledger(str(tmp_path), n=20)
+        engine = ReplayEngine(parallel=False, silent=True)
+        engine.load(path)
+        assert engine.head is engine.envelopes[-1]
+
+        engine.load(path, predicate=lambda e: 5 <= e.sequence < 10)
+        assert [e.sequence for e in engine.envelopes] == [5, 6, 7, 8, 9]
+        assert engine.loaded_count == 20 and engine.head.sequence == 19
+
+        engine.load(path, predicate=lambda e: e.agent_id == "nobody")
+        assert engine.envelopes == []
+        assert engine.loaded_count == 20 and engine.head.sequence == 19
+
+    def test_cli_chain_head_hash_ignores_agent_and_range_filters(self, tmp_path):
+        from click.testing import CliRunner
+        from guardclaw.cli import cli
+        _, _, path = _make_ledger(str(tmp_path), n=20)
+
+        def head(*args):
+            result = CliRunner().invoke(cli, ["verify", path, "--format", "json", *args])
+            out = json.loads(result.output)["guardclaw_verify"]
+            return out["chain_head_hash"], out["chain_head_sequence"]
+
+        full = head()
+        assert full[0] and full[1] == 19
+        assert head("--range", "0:5") == full
+        assert head("--agent", "adv-agent") == full
+        assert head("--agent", "nobody") == full
+
     def test_concurrent_emit_no_corruption(self, tmp_path):
         key = Ed25519KeyManager.generate()
         ledger = GEFLedger(key_manager=key, agent_id="threaded", ledger_path=str(tmp_path))
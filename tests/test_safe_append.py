@@ -217,4 +217,48 @@ class TestSafeAppend:
             t.join()
 
         assert errors == []
-        assert len(ledger.entries) == 1000
\ No newline at end of file
+        assert len(ledger.entries) == 1000
+
+    def test_emit_batch_appends_signed_chain(self, tmp_path):
+        """emit_batch: one write, every envelope signed and chained."""
+        _, ledger, path = _make(tmp_path, n=2)
+        envs = ledger.emit_batch(
+            [(RecordType.EXECUTION, {"b": i}) for i in range(5)]
+        )
+        assert [e.sequence for e in envs] == [2, 3, 4, 5, 6]
+        assert all(e.signature for e in envs)
+
+        s = _verify(path)
+        assert s.total_entries == 7
+        assert s.chain_valid
+
+    def test_emit_batch_rejects_invalid_type_atomically(self, tmp_path):
+        """An invalid record_type anywhere in the batch leaves the chain untouched."""
+        _, ledger, path = _make(tmp_path, n=2)
+        with pytest.raises(ValueError):
+            ledger.emit_batch([(RecordType.EXECUTION, {}), ("bogus", {})])
+        assert ledger.entry_count() == 2
+        assert _verify(path).total_entries == 2
+
+    def test_emit_batch_parallel_signing_verifies(self, tmp_path):
+        """sign_workers > 1 produces the same valid chain as sequential signing."""
+        _, ledger, path = _make(tmp_path, n=1)
+        envs = ledger.emit_batch(
+            [(RecordType.EXECUTION, {"p": i}) for i in range(9)], sign_workers=4
+        )
+        assert all(e.signature for e in envs)
+
+        s = _verify(path)
+        assert s.total_entries == 10
+        assert s.chain_valid
+        assert s.invalid_signatures == 0
+
+    def test_records_on_disk_match_stdlib_compact_json(self, tmp_path):
+        """Written bytes don't depend on orjson: non-ASCII, DEL and floats as stdlib writes them."""
+        _, ledger, path = _make(tmp_path, n=0)
+        ledger.emit(RecordType.EXECUTION, {"s": "é\x7f", "f": 1e16, "g": 0.1})
+        with open(path, "rb") as f:
+            line = f.readline()
+        expected = json.dumps(ledger.entries[0].to_dict(), separators=(",", ":")) + "\n"
+        assert line == expected.encode("utf-8")
+        assert line.isascii()